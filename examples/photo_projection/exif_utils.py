@@ -1,30 +1,98 @@
 """EXIF data extraction utilities for photo geolocation."""
 
+import io
+import itertools
+import json
+import os
+import sqlite3
+import struct
+import time
 import exifread
+import numpy as np
+from exifread.tags.exif import EXIF_TAGS
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple
 from pathlib import Path
 from ...src.cesiumjs_anywidget.logger import get_logger
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+try:
+    import piexif
+except ImportError:  # piexif is optional: exifread handles every file
+    piexif = None
+
 logger = get_logger(__name__)
 
+# exifread stops scanning an IFD once it reaches the tag named by ``stop_tag``.
+# Tags are stored in ascending ID order within each IFD, so each of these is
+# the last tag the corresponding helper needs.
+_GPS_STOP_TAG = 'GPSAltitude'
+_DATETIME_STOP_TAG = 'DateTimeOriginal'
+_CAMERA_STOP_TAG = 'FocalLengthIn35mmFilm'
 
-def _convert_to_degrees(value) -> float:
-    """Convert GPS coordinates to degrees.
+# JPEG stores EXIF in an APP1 segment capped at 64 KB near the start of the
+# file, so parsing a fixed-size head slice avoids reading the full image.
+_HEAD_BYTES = 128 * 1024
+_JPEG_SOI = b'\xff\xd8'
+
+# Start-of-frame markers carrying the image size (all SOFn except DHT, JPG, DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# Tags read through the piexif fast path: (piexif IFD, tag ID) ->
+# (exifread tag name, value kind), so the helpers below see the same names
+_PIEXIF_TAGS = {
+    ('0th', 0x010F): ('Image Make', 'ascii'),
+    ('0th', 0x0110): ('Image Model', 'ascii'),
+    ('0th', 0x0112): ('Image Orientation', 'int'),
+    ('0th', 0x0132): ('Image DateTime', 'ascii'),
+    ('Exif', 0x0132): ('EXIF DateTime', 'ascii'),
+    ('Exif', 0x9003): ('EXIF DateTimeOriginal', 'ascii'),
+    ('Exif', 0x920A): ('EXIF FocalLength', 'ratio'),
+    ('Exif', 0xA002): ('EXIF ExifImageWidth', 'int'),
+    ('Exif', 0xA003): ('EXIF ExifImageLength', 'int'),
+    ('Exif', 0xA405): ('EXIF FocalLengthIn35mmFilm', 'int'),
+    ('GPS', 0x0001): ('GPS GPSLatitudeRef', 'ascii'),
+    ('GPS', 0x0002): ('GPS GPSLatitude', 'ratio'),
+    ('GPS', 0x0003): ('GPS GPSLongitudeRef', 'ascii'),
+    ('GPS', 0x0004): ('GPS GPSLongitude', 'ratio'),
+    ('GPS', 0x0005): ('GPS GPSAltitudeRef', 'int'),
+    ('GPS', 0x0006): ('GPS GPSAltitude', 'ratio'),
+}
+
+# On-disk cache of batch results, keyed by absolute path, size and mtime.
+# Bump the version whenever the output of extract_all_metadata changes, so
+# that results cached by an older version are not served.
+_META_CACHE_VERSION = 3
+_META_CACHE_PATH = (
+    Path.home() / ".cache" / "cesiumjs_anywidget" / f"exif_meta_v{_META_CACHE_VERSION}.sqlite"
+)
+# Stay below SQLite's default limit on bound parameters per statement
+_SQL_BATCH = 500
+
+# Threads reading file heads ahead of the batch parser workers, and how many
+# files they may run ahead of the parsed results
+_PREFETCH_THREADS = 8
+_PREFETCH_WINDOW = 32
+
+
+@njit(cache=True)
+def _dms_to_degrees(d_num, d_den, m_num, m_den, s_num, s_den):
+    """Convert rational degrees, minutes, seconds to decimal degrees.
     
-    Parameters
-    ----------
-    value : exifread.utils.Ratio list
-        GPS coordinate in degrees, minutes, seconds format
-        
-    Returns
-    -------
-    float
-        Coordinate in decimal degrees
+    JIT-compiled with numba when available, as it runs for every coordinate
+    of every image in batch ingests.
     """
-    d = float(value.values[0].num) / float(value.values[0].den)
-    m = float(value.values[1].num) / float(value.values[1].den)
-    s = float(value.values[2].num) / float(value.values[2].den)
+    d = float(d_num) / float(d_den)
+    m = float(m_num) / float(m_den)
+    s = float(s_num) / float(s_den)
 
     # Normalize malformed DMS values from some writers
     # Some encoders store seconds as total arc-seconds * 60 (e.g., 1425 instead of 23.75)
@@ -44,6 +112,263 @@ def _convert_to_degrees(value) -> float:
     return d + (m / 60.0) + (s / 3600.0)
 
 
+def _convert_to_degrees(value) -> float:
+    """Convert GPS coordinates to degrees.
+    
+    Parameters
+    ----------
+    value : exifread.utils.Ratio list
+        GPS coordinate in degrees, minutes, seconds format
+        
+    Returns
+    -------
+    float
+        Coordinate in decimal degrees
+    """
+    d, m, s = value.values[:3]
+    return _dms_to_degrees(d.num, d.den, m.num, m.den, s.num, s.den)
+
+
+def _parse_exif_datetime(dt_str: str) -> datetime:
+    """Parse an EXIF datetime string ("YYYY:MM:DD HH:MM:SS").
+    
+    Slices the fixed-width fields directly, falling back to ``strptime`` for
+    strings that do not follow the fixed layout.
+    """
+    try:
+        return datetime(
+            int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]),
+            int(dt_str[11:13]), int(dt_str[14:16]), int(dt_str[17:19]),
+        )
+    except ValueError:
+        return datetime.strptime(dt_str, '%Y:%m:%d %H:%M:%S')
+
+
+class _Ratio(NamedTuple):
+    """Rational EXIF value, with the same fields as exifread's Ratio."""
+    num: int
+    den: int
+
+
+class _PiexifTag:
+    """Minimal stand-in for exifread's IfdTag, built from a piexif value."""
+    
+    __slots__ = ('values', 'printable')
+    
+    def __init__(self, tag_id: int, kind: str, value):
+        if kind == 'ascii':
+            # Strip only the NUL padding, as exifread does, so that trailing
+            # spaces match whichever reader parsed the file
+            self.printable = value.rstrip(b'\x00').decode('utf-8', 'replace')
+            self.values = self.printable
+        elif kind == 'ratio':
+            # piexif returns a single (num, den) pair or a tuple of pairs
+            pairs = value if isinstance(value[0], tuple) else (value,)
+            self.values = [_Ratio(num, den) for num, den in pairs]
+            self.printable = str(self.values)
+        else:
+            self.values = list(value) if isinstance(value, tuple) else [value]
+            # Use exifread's labels for enumerated tags such as Orientation
+            entry = EXIF_TAGS.get(tag_id, ())
+            labels = entry[1] if len(entry) > 1 and isinstance(entry[1], dict) else {}
+            first = self.values[0] if self.values else ''
+            self.printable = labels.get(first, str(first))
+    
+    def __str__(self) -> str:
+        return self.printable
+
+
+def _read_tags_piexif(data: bytes) -> Optional[Dict[str, Any]]:
+    """Read the tags of interest from JPEG data with piexif.
+    
+    piexif walks the IFDs several times faster than exifread. Returns None
+    when piexif is not installed or cannot parse the data, so the caller
+    can fall back to exifread.
+    """
+    if piexif is None:
+        return None
+    try:
+        exif_dict = piexif.load(data)
+        tags = {}
+        for (ifd, tag_id), (name, kind) in _PIEXIF_TAGS.items():
+            value = exif_dict[ifd].get(tag_id)
+            if value is not None:
+                tags[name] = _PiexifTag(tag_id, kind, value)
+        return tags
+    except Exception as e:
+        logger.debug("piexif could not parse EXIF data, using exifread: %s", e)
+        return None
+
+
+def _read_tags(image_path: str, stop_tag: str = exifread.DEFAULT_STOP_TAG) -> Dict[str, Any]:
+    """Read the EXIF tags of an image in a single pass.
+    
+    MakerNote decoding and thumbnail extraction are skipped since none of the
+    helpers use them. For JPEG files only the first ``_HEAD_BYTES`` are parsed,
+    with piexif when it is installed and exifread otherwise.
+    
+    Parameters
+    ----------
+    image_path : str
+        Path to the image file
+    stop_tag : str, optional
+        Bare tag name (without IFD prefix) after which exifread stops scanning
+        the IFD that contains it (piexif always reads the full IFDs)
+        
+    Returns
+    -------
+    dict
+        Mapping of exifread tag names to tag values
+    """
+    with open(image_path, 'rb') as f:
+        head = f.read(_HEAD_BYTES)
+        if head.startswith(_JPEG_SOI):
+            tags = _read_tags_piexif(head)
+            if tags is None:
+                tags = exifread.process_file(
+                    io.BytesIO(head), stop_tag=stop_tag, details=False, extract_thumbnail=False
+                )
+            # EXIF may sit behind large APPn segments: retry on the full file
+            if tags or len(head) < _HEAD_BYTES:
+                return tags
+        return exifread.process_file(
+            f, stop_tag=stop_tag, details=False, extract_thumbnail=False
+        )
+
+
+def _gps_from_tags(tags: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """Extract GPS coordinates from parsed EXIF tags.
+    
+    Returns None if the tags do not contain GPS latitude and longitude.
+    """
+    if 'GPS GPSLatitude' not in tags or 'GPS GPSLongitude' not in tags:
+        return None
+    
+    # Extract latitude
+    lat = _convert_to_degrees(tags['GPS GPSLatitude'])
+    if tags.get('GPS GPSLatitudeRef', 'N').values[0] == 'S':
+        lat = -lat
+    
+    # Extract longitude
+    lon = _convert_to_degrees(tags['GPS GPSLongitude'])
+    if tags.get('GPS GPSLongitudeRef', 'E').values[0] == 'W':
+        lon = -lon
+    
+    result = {
+        'latitude': lat,
+        'longitude': lon,
+    }
+    
+    # Extract altitude if available
+    if 'GPS GPSAltitude' in tags:
+        altitude = _first_ratio(tags['GPS GPSAltitude'])
+        
+        # Check altitude reference (0 = above sea level, 1 = below sea level)
+        if 'GPS GPSAltitudeRef' in tags:
+            alt_ref = tags['GPS GPSAltitudeRef'].values[0]
+            if alt_ref == 1:
+                altitude = -altitude
+        
+        result['altitude'] = altitude
+    
+    return result
+
+
+_DATETIME_TAGS = ('EXIF DateTimeOriginal', 'EXIF DateTime', 'Image DateTime')
+
+
+def _dt_from_tags(tags: Dict[str, Any]) -> Optional[datetime]:
+    """Extract the capture datetime from parsed EXIF tags.
+    
+    Returns None if no datetime tag is present.
+    """
+    # Try different datetime tags, in order of preference
+    for tag_name in _DATETIME_TAGS:
+        if tag_name in tags:
+            return _parse_exif_datetime(str(tags[tag_name]))
+    return None
+
+
+def _first_ratio(tag) -> float:
+    """Return the first value of a rational EXIF tag as a float."""
+    value = tag.values[0]
+    return float(value.num) / float(value.den)
+
+
+def _first_int(tag) -> int:
+    """Return the first value of an integer EXIF tag."""
+    return int(tag.values[0])
+
+
+# Camera tag name -> (metadata key, converter)
+_CAMERA_FIELDS = {
+    'Image Make': ('make', str),
+    'Image Model': ('model', str),
+    'EXIF FocalLength': ('focal_length_mm', _first_ratio),
+    'EXIF FocalLengthIn35mmFilm': ('focal_length_35mm', _first_int),
+    'EXIF ExifImageWidth': ('image_width', _first_int),
+    'EXIF ExifImageLength': ('image_height', _first_int),
+    'Image Orientation': ('orientation', str),
+}
+
+
+def _camera_from_tags(tags: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract camera information from parsed EXIF tags."""
+    result = {}
+    # Walk the ordered table so the result keys come out in a fixed order
+    for tag_name, (key, convert) in _CAMERA_FIELDS.items():
+        if tag_name in tags:
+            result[key] = convert(tags[tag_name])
+    return result
+
+
+def _parse_tags(tags: Dict[str, Any], image_path: str) -> Dict[str, Any]:
+    """Build the GPS, datetime and camera metadata from parsed EXIF tags.
+    
+    Each group is extracted independently so that a malformed tag in one
+    group does not discard the others.
+    
+    Parameters
+    ----------
+    tags : dict
+        Tags returned by :func:`_read_tags`
+    image_path : str
+        Path to the image file (used for log messages only)
+        
+    Returns
+    -------
+    dict
+        Merged metadata dictionary
+    """
+    metadata = {}
+    
+    try:
+        gps_data = _gps_from_tags(tags)
+        if gps_data:
+            metadata.update(gps_data)
+        else:
+            logger.warning("No GPS data found in %s", image_path)
+    except Exception as e:
+        logger.error("Error extracting GPS data from %s: %s", image_path, e)
+    
+    try:
+        dt = _dt_from_tags(tags)
+        if dt:
+            metadata['datetime'] = dt
+            metadata['datetime_str'] = dt.isoformat()
+        else:
+            logger.warning("No datetime found in %s", image_path)
+    except Exception as e:
+        logger.error("Error extracting datetime from %s: %s", image_path, e)
+    
+    try:
+        metadata.update(_camera_from_tags(tags))
+    except Exception as e:
+        logger.error("Error extracting camera info from %s: %s", image_path, e)
+    
+    return metadata
+
+
 def extract_gps_data(image_path: str) -> Optional[Dict[str, float]]:
     """Extract GPS coordinates from image EXIF data.
     
@@ -65,47 +390,17 @@ def extract_gps_data(image_path: str) -> Optional[Dict[str, float]]:
     ...     print(f"Location: {gps_data['latitude']}, {gps_data['longitude']}")
     """
     try:
-        with open(image_path, 'rb') as f:
-            tags = exifread.process_file(f, details=False)
+        result = _gps_from_tags(_read_tags(image_path, _GPS_STOP_TAG))
         
-        # Check if GPS data exists
-        if 'GPS GPSLatitude' not in tags or 'GPS GPSLongitude' not in tags:
-            logger.warning(f"No GPS data found in {image_path}")
+        if result is None:
+            logger.warning("No GPS data found in %s", image_path)
             return None
         
-        # Extract latitude
-        lat = _convert_to_degrees(tags['GPS GPSLatitude'])
-        if tags.get('GPS GPSLatitudeRef', 'N').values[0] == 'S':
-            lat = -lat
-        
-        # Extract longitude
-        lon = _convert_to_degrees(tags['GPS GPSLongitude'])
-        if tags.get('GPS GPSLongitudeRef', 'E').values[0] == 'W':
-            lon = -lon
-        
-        result = {
-            'latitude': lat,
-            'longitude': lon,
-        }
-        
-        # Extract altitude if available
-        if 'GPS GPSAltitude' in tags:
-            alt_tag = tags['GPS GPSAltitude']
-            altitude = float(alt_tag.values[0].num) / float(alt_tag.values[0].den)
-            
-            # Check altitude reference (0 = above sea level, 1 = below sea level)
-            if 'GPS GPSAltitudeRef' in tags:
-                alt_ref = tags['GPS GPSAltitudeRef'].values[0]
-                if alt_ref == 1:
-                    altitude = -altitude
-            
-            result['altitude'] = altitude
-        
-        logger.info(f"Extracted GPS data from {image_path}: {result}")
+        logger.info("Extracted GPS data from %s: %s", image_path, result)
         return result
         
     except Exception as e:
-        logger.error(f"Error extracting GPS data from {image_path}: {e}")
+        logger.error("Error extracting GPS data from %s: %s", image_path, e)
         return None
 
 
@@ -129,23 +424,17 @@ def extract_datetime(image_path: str) -> Optional[datetime]:
     ...     print(f"Captured on: {dt.strftime('%Y-%m-%d %H:%M:%S')}")
     """
     try:
-        with open(image_path, 'rb') as f:
-            tags = exifread.process_file(f, details=False)
+        dt = _dt_from_tags(_read_tags(image_path, _DATETIME_STOP_TAG))
         
-        # Try different datetime tags
-        for tag_name in ['EXIF DateTimeOriginal', 'EXIF DateTime', 'Image DateTime']:
-            if tag_name in tags:
-                dt_str = str(tags[tag_name])
-                # Parse datetime (format: "YYYY:MM:DD HH:MM:SS")
-                dt = datetime.strptime(dt_str, '%Y:%m:%d %H:%M:%S')
-                logger.info(f"Extracted datetime from {image_path}: {dt}")
-                return dt
+        if dt is None:
+            logger.warning("No datetime found in %s", image_path)
+            return None
         
-        logger.warning(f"No datetime found in {image_path}")
-        return None
+        logger.info("Extracted datetime from %s: %s", image_path, dt)
+        return dt
         
     except Exception as e:
-        logger.error(f"Error extracting datetime from {image_path}: {e}")
+        logger.error("Error extracting datetime from %s: %s", image_path, e)
         return None
 
 
@@ -167,44 +456,56 @@ def extract_camera_info(image_path: str) -> Dict[str, Any]:
     >>> info = extract_camera_info('photo.jpg')
     >>> print(f"Camera: {info.get('make')} {info.get('model')}")
     """
-    result = {}
-    
     try:
-        with open(image_path, 'rb') as f:
-            tags = exifread.process_file(f, details=False)
-        
-        # Camera make and model
-        if 'Image Make' in tags:
-            result['make'] = str(tags['Image Make'])
-        if 'Image Model' in tags:
-            result['model'] = str(tags['Image Model'])
-        
-        # Focal length
-        if 'EXIF FocalLength' in tags:
-            focal_tag = tags['EXIF FocalLength']
-            focal_length = float(focal_tag.values[0].num) / float(focal_tag.values[0].den)
-            result['focal_length_mm'] = focal_length
-        
-        # Focal length in 35mm equivalent
-        if 'EXIF FocalLengthIn35mmFilm' in tags:
-            result['focal_length_35mm'] = int(tags['EXIF FocalLengthIn35mmFilm'].values[0])
-        
-        # Image dimensions
-        if 'EXIF ExifImageWidth' in tags:
-            result['image_width'] = int(tags['EXIF ExifImageWidth'].values[0])
-        if 'EXIF ExifImageLength' in tags:
-            result['image_height'] = int(tags['EXIF ExifImageLength'].values[0])
-        
-        # Orientation
-        if 'Image Orientation' in tags:
-            result['orientation'] = str(tags['Image Orientation'])
-        
-        logger.info(f"Extracted camera info from {image_path}: {result}")
+        result = _camera_from_tags(_read_tags(image_path, _CAMERA_STOP_TAG))
+        logger.info("Extracted camera info from %s: %s", image_path, result)
         return result
         
     except Exception as e:
-        logger.error(f"Error extracting camera info from {image_path}: {e}")
-        return result
+        logger.error("Error extracting camera info from %s: %s", image_path, e)
+        return {}
+
+
+def _jpeg_dimensions(image_path: str) -> Optional[Tuple[int, int]]:
+    """Read JPEG dimensions from the start-of-frame segment header.
+    
+    Only segment headers are read, never the compressed image data.
+    
+    Returns
+    -------
+    tuple or None
+        (width, height) in pixels, or None if the file is not a JPEG or no
+        start-of-frame segment precedes the image data
+    """
+    with open(image_path, 'rb') as f:
+        if f.read(2) != _JPEG_SOI:
+            return None
+        
+        while True:
+            if f.read(1) != b'\xff':
+                return None
+            marker = f.read(1)
+            while marker == b'\xff':  # Fill bytes
+                marker = f.read(1)
+            if not marker:
+                return None
+            
+            code = marker[0]
+            if code == 0x01 or 0xD0 <= code <= 0xD8:  # Markers without payload
+                continue
+            if code in (0xD9, 0xDA):  # End of image / start of scan
+                return None
+            
+            header = f.read(2)
+            if len(header) < 2:
+                return None
+            if code in _JPEG_SOF_MARKERS:
+                frame = f.read(5)  # precision, height, width
+                if len(frame) < 5:
+                    return None
+                height, width = struct.unpack('>HH', frame[1:])
+                return width, height
+            f.seek(struct.unpack('>H', header)[0] - 2, os.SEEK_CUR)
 
 
 def get_image_dimensions(image_path: str) -> Optional[Tuple[int, int]]:
@@ -221,11 +522,16 @@ def get_image_dimensions(image_path: str) -> Optional[Tuple[int, int]]:
         (width, height) in pixels, or None if unable to read
     """
     try:
+        # Scan JPEG segment headers directly; use PIL for other formats
+        dims = _jpeg_dimensions(image_path)
+        if dims is not None:
+            return dims
+        
         from PIL import Image
         with Image.open(image_path) as img:
             return img.size
     except Exception as e:
-        logger.error(f"Error reading image dimensions from {image_path}: {e}")
+        logger.error("Error reading image dimensions from %s: %s", image_path, e)
         return None
 
 
@@ -253,24 +559,18 @@ def extract_all_metadata(image_path: str) -> Dict[str, Any]:
      'make': 'Canon', 'model': 'EOS R5', ...}
     """
     metadata = {
-        'file_path': str(Path(image_path).absolute()),
-        'file_name': Path(image_path).name,
+        'file_path': os.path.abspath(image_path),
+        'file_name': os.path.basename(image_path),
     }
     
-    # GPS data
-    gps_data = extract_gps_data(image_path)
-    if gps_data:
-        metadata.update(gps_data)
-    
-    # Datetime
-    dt = extract_datetime(image_path)
-    if dt:
-        metadata['datetime'] = dt
-        metadata['datetime_str'] = dt.isoformat()
-    
-    # Camera info
-    camera_info = extract_camera_info(image_path)
-    metadata.update(camera_info)
+    # GPS, datetime and camera info share a single EXIF parse; the camera stop
+    # tag is the last one needed in the EXIF IFD and the GPS IFD is read fully
+    try:
+        tags = _read_tags(image_path, _CAMERA_STOP_TAG)
+    except Exception as e:
+        logger.error("Error reading EXIF data from %s: %s", image_path, e)
+        tags = {}
+    metadata.update(_parse_tags(tags, image_path))
     
     # Image dimensions
     dims = get_image_dimensions(image_path)
@@ -279,3 +579,197 @@ def extract_all_metadata(image_path: str) -> Dict[str, Any]:
         metadata['height'] = dims[1]
     
     return metadata
+
+
+def _prefetch_head(image_path: str) -> None:
+    """Read the head of a file so that a later parse hits the OS page cache."""
+    try:
+        with open(image_path, 'rb') as f:
+            f.read(_HEAD_BYTES)
+    except OSError:
+        pass  # Reported by extract_all_metadata
+
+
+def _open_metadata_cache() -> Optional[sqlite3.Connection]:
+    """Open (and create if needed) the on-disk metadata cache.
+    
+    Returns None if the cache cannot be opened, in which case batch
+    extraction proceeds without caching.
+    """
+    try:
+        _META_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(_META_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta "
+            "(path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, json TEXT)"
+        )
+        return conn
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Metadata cache unavailable at %s: %s", _META_CACHE_PATH, e)
+        return None
+
+
+def _metadata_to_json(metadata: Dict[str, Any]) -> str:
+    """Serialize a metadata dictionary for the cache.
+    
+    The ``datetime`` object is dropped since ``datetime_str`` carries it.
+    """
+    return json.dumps({k: v for k, v in metadata.items() if k != 'datetime'})
+
+
+def _metadata_from_json(text: str) -> Dict[str, Any]:
+    """Rebuild a metadata dictionary serialized by :func:`_metadata_to_json`."""
+    metadata = json.loads(text)
+    if 'datetime_str' in metadata:
+        metadata['datetime'] = datetime.fromisoformat(metadata['datetime_str'])
+    return metadata
+
+
+def _load_cached_metadata(
+    conn: sqlite3.Connection, keys: Dict[str, Tuple[int, int]]
+) -> Dict[str, Dict[str, Any]]:
+    """Return the cached metadata whose (size, mtime) still match ``keys``."""
+    cached = {}
+    paths = list(keys)
+    for i in range(0, len(paths), _SQL_BATCH):
+        chunk = paths[i:i + _SQL_BATCH]
+        rows = conn.execute(
+            f"SELECT path, size, mtime, json FROM meta "
+            f"WHERE path IN ({','.join('?' * len(chunk))})",
+            chunk,
+        )
+        for path, size, mtime, text in rows:
+            if keys[path] == (size, mtime):
+                cached[path] = _metadata_from_json(text)
+    return cached
+
+
+def extract_all_metadata_batch(
+    image_paths: List[str], max_workers: Optional[int] = None, use_cache: bool = True
+) -> List[Dict[str, Any]]:
+    """Extract all relevant metadata from many images in parallel.
+    
+    Files are distributed over a process pool, each worker running
+    :func:`extract_all_metadata`. Results are returned in input order.
+    
+    Results are cached on disk keyed by (absolute path, size, mtime), so
+    re-scanning a folder only parses files that were added or modified.
+    
+    Parameters
+    ----------
+    image_paths : list of str
+        Paths to the image files
+    max_workers : int, optional
+        Number of worker processes (default: number of CPUs)
+    use_cache : bool, optional
+        Read and update the on-disk metadata cache (default: True)
+        
+    Returns
+    -------
+    list of dict
+        One metadata dictionary per input path
+        
+    Examples
+    --------
+    >>> from pathlib import Path
+    >>> photos = sorted(str(p) for p in Path('photos').glob('*.jpg'))
+    >>> metadata = extract_all_metadata_batch(photos)
+    """
+    image_paths = [os.path.abspath(p) for p in image_paths]
+    if not image_paths:
+        return []
+    
+    start = time.perf_counter()
+    
+    # Phase 1: stat every file and reuse cached results for unchanged ones
+    keys = {}
+    for path in image_paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue  # Reported by extract_all_metadata below
+        keys[path] = (st.st_size, st.st_mtime_ns)
+    
+    conn = _open_metadata_cache() if use_cache else None
+    results = {}
+    if conn is not None:
+        try:
+            results = _load_cached_metadata(conn, keys)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Ignoring unreadable metadata cache: %s", e)
+    
+    # Phase 2: parse only new or modified files
+    pending = list(dict.fromkeys(p for p in image_paths if p not in results))
+    workers = 0
+    if pending:
+        workers = min(max_workers or os.cpu_count() or 1, len(pending))
+        # A few chunks per worker balances load without per-file IPC overhead
+        chunksize = max(1, len(pending) // (4 * workers))
+        # Reader threads pull file heads into the page cache in parsing order,
+        # overlapping disk latency with the CPU-bound EXIF parsing. They stay
+        # at most _PREFETCH_WINDOW files ahead, topped up as results arrive.
+        ahead = iter(pending)
+        with ThreadPoolExecutor(max_workers=_PREFETCH_THREADS) as prefetch, \
+                ProcessPoolExecutor(max_workers=workers) as pool:
+            for path in itertools.islice(ahead, _PREFETCH_WINDOW):
+                prefetch.submit(_prefetch_head, path)
+            parsed = pool.map(extract_all_metadata, pending, chunksize=chunksize)
+            for path, metadata in zip(pending, parsed):
+                results[path] = metadata
+                next_path = next(ahead, None)
+                if next_path is not None:
+                    prefetch.submit(_prefetch_head, next_path)
+    
+    if conn is not None:
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (path, size, mtime, json) VALUES (?, ?, ?, ?)",
+                    [(p, *keys[p], _metadata_to_json(results[p])) for p in pending if p in keys],
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Could not update metadata cache: %s", e)
+        finally:
+            conn.close()
+    
+    logger.info(
+        "Extracted metadata from %d images (%d cached, %d parsed with %d workers) in %.2fs",
+        len(image_paths), len(image_paths) - len(pending), len(pending), workers,
+        time.perf_counter() - start,
+    )
+    return [results[p] for p in image_paths]
+
+
+def metadata_to_columns(records: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Convert a list of metadata dictionaries into columnar NumPy arrays.
+    
+    Contiguous columns are much more compact than one dictionary per photo
+    and can be passed straight to vectorized functions, e.g. converting the
+    altitudes of a whole flight with one ``msl_to_wgs84_array`` call.
+    
+    Parameters
+    ----------
+    records : list of dict
+        Metadata dictionaries as returned by :func:`extract_all_metadata`
+        or :func:`extract_all_metadata_batch`
+        
+    Returns
+    -------
+    dict
+        Arrays of length ``len(records)``: 'latitude', 'longitude' and
+        'altitude' (float64, NaN where missing) and 'datetime'
+        (datetime64[s], NaT where missing)
+        
+    Examples
+    --------
+    >>> columns = metadata_to_columns(extract_all_metadata_batch(photos))
+    >>> wgs84 = msl_to_wgs84_array(columns['altitude'], columns['latitude'],
+    ...                            columns['longitude'])
+    """
+    n = len(records)
+    columns = {
+        key: np.fromiter((r.get(key, np.nan) for r in records), dtype=np.float64, count=n)
+        for key in ('latitude', 'longitude', 'altitude')
+    }
+    columns['datetime'] = np.array([r.get('datetime') for r in records], dtype='datetime64[s]')
+    return columns
@@ -1,23 +1,47 @@
 """CesiumJS Anywidget - A Jupyter widget for CesiumJS 3D globe visualization."""
 
+from importlib import import_module
+
 from .widget import CesiumWidget
-from .geoid import (
-    get_geoid_undulation,
-    msl_to_wgs84,
-    wgs84_to_msl,
-    clear_geoid_cache,
-    set_geoid_data_url,
-)
 from .logger import get_logger, set_log_level
 
+# Geoid helpers are imported on first access (PEP 562) so that widget-only
+# users do not pay for loading the geoid module and its dependencies.
+_LAZY_ATTRIBUTES = {
+    "get_geoid_undulation": ".geoid",
+    "get_geoid_undulation_array": ".geoid",
+    "msl_to_wgs84": ".geoid",
+    "msl_to_wgs84_array": ".geoid",
+    "wgs84_to_msl": ".geoid",
+    "wgs84_to_msl_array": ".geoid",
+    "clear_geoid_cache": ".geoid",
+    "set_geoid_data_url": ".geoid",
+}
+
 __version__ = "0.6.0"
 __all__ = [
     "CesiumWidget",
     "get_geoid_undulation",
+    "get_geoid_undulation_array",
     "msl_to_wgs84",
+    "msl_to_wgs84_array",
     "wgs84_to_msl",
+    "wgs84_to_msl_array",
     "clear_geoid_cache",
     "set_geoid_data_url",
     "get_logger",
     "set_log_level",
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,15 +7,19 @@ The EGM96 15-minute grid data is automatically downloaded from the internet on
 first use and cached locally. You can customize the data source URL if needed.
 """
 
-import tarfile
-import urllib.request
-import zipfile
+import atexit
+import hashlib
+import sqlite3
+import threading
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = get_logger(__name__)
 
 
@@ -26,14 +30,38 @@ DEFAULT_EGM96_URL = "https://earth-info.nga.mil/php/download.php?file=egm-96inte
 # User-configurable URL (can be changed before first use)
 _EGM96_DATA_URL: Optional[str] = None
 
+# Optional SHA-256 hex digest the downloaded archive must match
+_EGM96_SHA256: Optional[str] = None
+
+# Read size when streaming the archive download to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 # Cached geoid model
 _geoid_model = None
 
+# Cached vectorized interpolator over the EGM96 grid (see get_geoid_undulation_array)
+_geoid_spline = None
+
 # Cache directory for downloaded geoid files
 _CACHE_DIR = Path.home() / ".cache" / "cesiumjs_anywidget" / "geoid"
 
+# Undulation lookups are cached on a 1e-4 degree (~11 m) grid so that nearby
+# queries, such as a stream of GPS fixes, share cache entries. The geoid varies
+# by at most a few millimetres over that distance, far below EGM96 accuracy.
+_UNDULATION_GRID_STEPS_PER_DEGREE = 10_000
 
-def set_geoid_data_url(url: str) -> None:
+# Undulations at lookup grid nodes are also persisted across sessions in a
+# SQLite file (one per data source URL and grid step). New values are
+# buffered and written in batches so that a cold lookup does not pay for a
+# disk sync.
+_undulation_db: Optional[sqlite3.Connection] = None
+_undulation_db_disabled = False
+_pending_undulations: dict = {}
+_UNDULATION_FLUSH_SIZE = 256
+_undulation_db_lock = threading.Lock()
+
+
+def set_geoid_data_url(url: str, sha256: Optional[str] = None) -> None:
     """Set a custom URL for downloading EGM96 geoid data.
     
     This must be called before the first use of geoid functions.
@@ -42,20 +70,71 @@ def set_geoid_data_url(url: str) -> None:
     ----------
     url : str
         URL to download EGM96 grid data (tar.bz2 or direct grid file)
+    sha256 : str, optional
+        Expected SHA-256 hex digest of the downloaded archive. When given,
+        a download with a different digest is discarded with an error.
         
     Examples
     --------
     >>> from cesiumjs_anywidget.geoid import set_geoid_data_url
     >>> set_geoid_data_url("https://example.com/egm96-15.tar.bz2")
     """
-    global _EGM96_DATA_URL, _geoid_model
+    global _EGM96_DATA_URL, _EGM96_SHA256, _geoid_model, _geoid_spline
+    # Persist pending values under the old source before switching
+    _close_undulation_db()
     _EGM96_DATA_URL = url
+    _EGM96_SHA256 = sha256
     # Clear cached model to force reload with new URL
     _geoid_model = None
-    get_geoid_undulation.cache_clear()
+    _geoid_spline = None
+    _undulation_at_grid_node.cache_clear()
 
 
-def _download_egm96_grid(url: str, cache_dir: Path) -> Path:
+def _download_archive(url: str, archive_path: Path, sha256: Optional[str] = None) -> None:
+    """Stream a download to disk, hashing it on the fly.
+    
+    The body is written in chunks to a ``.part`` file which is renamed to
+    ``archive_path`` only once complete (and verified), so an interrupted
+    download never leaves a corrupt archive behind.
+    
+    Parameters
+    ----------
+    url : str
+        URL to download
+    archive_path : Path
+        Destination file
+    sha256 : str, optional
+        Expected SHA-256 hex digest of the download
+        
+    Raises
+    ------
+    ValueError
+        If the digest of the download does not match ``sha256``
+    """
+    import urllib.request
+    
+    part_path = archive_path.with_name(archive_path.name + ".part")
+    digest = hashlib.sha256()
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    
+    try:
+        with urllib.request.urlopen(request) as response, open(part_path, "wb") as out:
+            while chunk := response.read(_DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                out.write(chunk)
+        
+        actual = digest.hexdigest()
+        logger.info("Downloaded archive SHA-256: %s", actual)
+        if sha256 is not None and actual != sha256.lower():
+            raise ValueError(
+                f"SHA-256 mismatch for {url}: expected {sha256.lower()}, got {actual}"
+            )
+        part_path.replace(archive_path)
+    finally:
+        part_path.unlink(missing_ok=True)
+
+
+def _download_egm96_grid(url: str, cache_dir: Path, sha256: Optional[str] = None) -> Path:
     """Download and extract the EGM96 grid file from an archive (zip or tar.bz2).
     
     Parameters
@@ -64,6 +143,8 @@ def _download_egm96_grid(url: str, cache_dir: Path) -> Path:
         URL to download the archive from
     cache_dir : Path
         Directory to store the extracted grid file
+    sha256 : str, optional
+        Expected SHA-256 hex digest of the archive
         
     Returns
     -------
@@ -74,6 +155,8 @@ def _download_egm96_grid(url: str, cache_dir: Path) -> Path:
     ------
     FileNotFoundError
         If no .GRD file found in archive
+    ValueError
+        If the archive does not match the expected SHA-256 digest
     Exception
         If download or extraction fails
     """
@@ -90,10 +173,13 @@ def _download_egm96_grid(url: str, cache_dir: Path) -> Path:
     
     if not archive_path.exists():
         logger.info("Downloading EGM96 grid data from %s...", url)
-        urllib.request.urlretrieve(url, archive_path)
+        _download_archive(url, archive_path, sha256)
         logger.info("Download complete: %s", archive_path)
     
     # Detect archive type and extract
+    import tarfile
+    import zipfile
+    
     logger.info("Extracting %s...", archive_path)
     
     try:
@@ -143,6 +229,13 @@ def _download_egm96_grid(url: str, cache_dir: Path) -> Path:
     return grd_file
 
 
+def _egm96_grid_file() -> Path:
+    """Return the local EGM96 grid file, downloading it on first use."""
+    # Use custom URL if set, otherwise use default
+    url = _EGM96_DATA_URL if _EGM96_DATA_URL else DEFAULT_EGM96_URL
+    return _download_egm96_grid(url, _CACHE_DIR, _EGM96_SHA256)
+
+
 def _get_geoid_model():
     """Get or create the cached EGM96 geoid model.
     
@@ -160,11 +253,8 @@ def _get_geoid_model():
         from pygeodesy.geoids import GeoidEGM96
         from pygeodesy.datums import Datums
         
-        # Use custom URL if set, otherwise use default
-        url = _EGM96_DATA_URL if _EGM96_DATA_URL else DEFAULT_EGM96_URL
-        
         # Download and extract the grid file if needed
-        grd_file = _download_egm96_grid(url, _CACHE_DIR)
+        grd_file = _egm96_grid_file()
         
         # Create the GeoidEGM96 model with the grid file path
         _geoid_model = GeoidEGM96(str(grd_file), datum=Datums.WGS84)
@@ -172,7 +262,180 @@ def _get_geoid_model():
     return _geoid_model
 
 
-@lru_cache(maxsize=1000)
+def _load_grid_values(grd_file: Path) -> "np.ndarray":
+    """Load the numbers of a text .GRD file as a flat float array.
+    
+    Parsing the text grid is by far the slowest part of building the
+    interpolator, so the parsed values are saved next to it in binary .npy
+    form and memory-mapped on later loads. The mapping is read-only, so
+    worker processes share its pages through the OS page cache.
+    """
+    import numpy as np
+    
+    npy_file = grd_file.with_suffix(".npy")
+    try:
+        if npy_file.stat().st_mtime_ns >= grd_file.stat().st_mtime_ns:
+            return np.load(npy_file, mmap_mode="r")
+    except (OSError, ValueError):
+        pass  # Missing or unreadable binary copy: parse the text grid
+    
+    values = np.fromfile(grd_file, sep=" ")
+    tmp_file = npy_file.with_name(npy_file.name + ".part")
+    try:
+        with open(tmp_file, "wb") as f:
+            np.save(f, values)
+        tmp_file.replace(npy_file)
+    except OSError as e:
+        logger.debug("Could not cache parsed geoid grid at %s: %s", npy_file, e)
+        tmp_file.unlink(missing_ok=True)
+    return values
+
+
+def _get_geoid_spline():
+    """Get or create the cached vectorized interpolator over the EGM96 grid.
+    
+    The grid file is loaded once into a NumPy array and fitted with the same
+    bicubic spline that GeoidEGM96 uses by default, so results agree with
+    get_geoid_undulation.
+    
+    Returns
+    -------
+    scipy.interpolate.RectBivariateSpline
+        Spline over (-latitude, east longitude in [0, 360)) in degrees
+    """
+    global _geoid_spline
+    
+    if _geoid_spline is None:
+        import numpy as np
+        from scipy.interpolate import RectBivariateSpline
+        
+        grd_file = _egm96_grid_file()
+        
+        # Text grid: a 6-value header (south, north, west, east, dlat, dlon)
+        # followed by rows from north to south, each from 0 to 360 degrees east
+        values = _load_grid_values(grd_file)
+        south, north, west, east, dlat, dlon = values[:6]
+        nlat = int(round((north - south) / dlat)) + 1
+        nlon = int(round((east - west) / dlon)) + 1
+        heights = values[6:].reshape(nlat, nlon)
+        
+        # Rows run north to south, i.e. ascending in -latitude
+        neg_lats = np.linspace(south, north, nlat)
+        lons = np.linspace(west, east, nlon)
+        _geoid_spline = RectBivariateSpline(
+            neg_lats, lons, heights,
+            bbox=[neg_lats[0], neg_lats[-1], lons[0], lons[-1] + dlon],
+            kx=3, ky=3, s=0,
+        )
+    
+    return _geoid_spline
+
+
+def _undulation_db_path() -> Path:
+    """Path of the persistent undulation cache for the current data source.
+    
+    The file name encodes the source URL and the lookup grid step, since
+    cached values are only valid for that combination.
+    """
+    url = _EGM96_DATA_URL if _EGM96_DATA_URL else DEFAULT_EGM96_URL
+    source_key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return _CACHE_DIR / f"undulation-{source_key}-{_UNDULATION_GRID_STEPS_PER_DEGREE}.sqlite"
+
+
+def _get_undulation_db() -> Optional[sqlite3.Connection]:
+    """Get or open the persistent undulation cache for the current data source.
+    
+    Returns None if the cache cannot be opened; lookups then fall back to
+    the geoid model alone. Must be called with _undulation_db_lock held.
+    """
+    global _undulation_db, _undulation_db_disabled
+    
+    if _undulation_db is None and not _undulation_db_disabled:
+        db_path = _undulation_db_path()
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS undulation ("
+                "lat INTEGER NOT NULL, lon INTEGER NOT NULL, value REAL NOT NULL, "
+                "PRIMARY KEY (lat, lon)) WITHOUT ROWID"
+            )
+            _undulation_db = conn
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Persistent geoid cache disabled (%s): %s", db_path, e)
+            _undulation_db_disabled = True
+    
+    return _undulation_db
+
+
+def _flush_pending_undulations() -> None:
+    """Write buffered undulation values to disk. Requires _undulation_db_lock."""
+    if not _pending_undulations:
+        return  # Do not open (and so create) the cache with nothing to write
+    conn = _get_undulation_db()
+    if conn is not None:
+        rows = [(lat, lon, value) for (lat, lon), value in _pending_undulations.items()]
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO undulation (lat, lon, value) VALUES (?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.warning("Failed to persist %d geoid undulations: %s", len(rows), e)
+    _pending_undulations.clear()
+
+
+def _close_undulation_db() -> None:
+    """Flush and close the persistent undulation cache."""
+    global _undulation_db, _undulation_db_disabled
+    with _undulation_db_lock:
+        _flush_pending_undulations()
+        if _undulation_db is not None:
+            _undulation_db.close()
+        _undulation_db = None
+        _undulation_db_disabled = False
+
+
+atexit.register(_close_undulation_db)
+
+
+@lru_cache(maxsize=4096)
+def _undulation_at_grid_node(lat_index: int, lon_index: int) -> float:
+    """Return the geoid undulation at a node of the lookup cache grid.
+    
+    The persistent cache is consulted first, so the geoid model is only
+    loaded for nodes that have never been evaluated.
+    """
+    key = (lat_index, lon_index)
+    with _undulation_db_lock:
+        conn = _get_undulation_db()
+        if conn is not None:
+            try:
+                row = conn.execute(
+                    "SELECT value FROM undulation WHERE lat = ? AND lon = ?", key
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                return row[0]
+    
+    geoid = _get_geoid_model()
+    
+    # GeoidEGM96.height() accepts lat, lon directly
+    value = geoid.height(
+        lat_index / _UNDULATION_GRID_STEPS_PER_DEGREE,
+        lon_index / _UNDULATION_GRID_STEPS_PER_DEGREE,
+    )
+    
+    with _undulation_db_lock:
+        _pending_undulations[key] = value
+        if len(_pending_undulations) >= _UNDULATION_FLUSH_SIZE:
+            _flush_pending_undulations()
+    
+    return value
+
+
 def get_geoid_undulation(latitude: float, longitude: float) -> float:
     """Calculate the geoid undulation at a given location using EGM96.
     
@@ -207,12 +470,61 @@ def get_geoid_undulation(latitude: float, longitude: float) -> float:
     -----
     The EGM96 model provides approximately ±0.5 to ±1 meter accuracy globally.
     The grid data is downloaded automatically from GeographicLib on first use.
-    """
-    geoid = _get_geoid_model()
     
-    # GeoidEGM96.height() accepts lat, lon directly
-    return geoid.height(latitude, longitude)
+    Results are cached per 1e-4 degree cell (about 11 m), so nearby locations
+    return the undulation evaluated at the closest cell node. The cache is
+    persisted under ~/.cache/cesiumjs_anywidget/geoid and reused across
+    sessions.
+    """
+    steps = _UNDULATION_GRID_STEPS_PER_DEGREE
+    # Normalize longitude to [-180, 180) so both input conventions share
+    # cache entries
+    return _undulation_at_grid_node(
+        round(latitude * steps),
+        (round(longitude * steps) + 180 * steps) % (360 * steps) - 180 * steps,
+    )
+
 
+def get_geoid_undulation_array(latitudes, longitudes) -> "np.ndarray":
+    """Calculate geoid undulations for many locations at once using EGM96.
+    
+    Vectorized counterpart of get_geoid_undulation for tracks of points:
+    the whole array is interpolated in a single call instead of one Python
+    call per point.
+    
+    Parameters
+    ----------
+    latitudes : array_like
+        Latitudes in degrees (-90 to 90)
+    longitudes : array_like
+        Longitudes in degrees (-180 to 180 or 0 to 360), broadcastable
+        against latitudes
+        
+    Returns
+    -------
+    numpy.ndarray
+        Geoid undulations in meters, with the broadcast shape of the inputs
+        
+    Raises
+    ------
+    ValueError
+        If any latitude is outside [-90, 90]
+        
+    Examples
+    --------
+    >>> undulations = get_geoid_undulation_array([46.0, 50.0], [4.0, 10.0])
+    >>> undulations.shape
+    (2,)
+    """
+    import numpy as np
+    
+    lats, lons = np.broadcast_arrays(
+        np.asarray(latitudes, dtype=float), np.asarray(longitudes, dtype=float)
+    )
+    if np.any(np.abs(lats) > 90):
+        raise ValueError("Latitudes must be between -90 and 90 degrees")
+    
+    return _get_geoid_spline().ev(-lats, np.mod(lons, 360.0))
 
 
 def msl_to_wgs84(altitude_msl: float, latitude: float, longitude: float) -> float:
@@ -286,13 +598,84 @@ def wgs84_to_msl(altitude_wgs84: float, latitude: float, longitude: float) -> fl
     return altitude_wgs84 - geoid_undulation
 
 
+def msl_to_wgs84_array(altitudes_msl, latitudes, longitudes) -> "np.ndarray":
+    """Convert arrays of MSL altitudes to WGS84 ellipsoid heights.
+    
+    Vectorized counterpart of msl_to_wgs84.
+    
+    Parameters
+    ----------
+    altitudes_msl : array_like
+        Altitudes above Mean Sea Level in meters
+    latitudes : array_like
+        Latitudes in degrees (-90 to 90)
+    longitudes : array_like
+        Longitudes in degrees (-180 to 180 or 0 to 360)
+        
+    Returns
+    -------
+    numpy.ndarray
+        Heights above WGS84 ellipsoid in meters
+        
+    Examples
+    --------
+    >>> heights = msl_to_wgs84_array([0, 1000], [46.0, 46.0], [4.0, 4.0])
+    """
+    import numpy as np
+    
+    undulations = get_geoid_undulation_array(latitudes, longitudes)
+    return np.asarray(altitudes_msl, dtype=float) + undulations
+
+
+def wgs84_to_msl_array(altitudes_wgs84, latitudes, longitudes) -> "np.ndarray":
+    """Convert arrays of WGS84 ellipsoid heights to MSL altitudes.
+    
+    Vectorized counterpart of wgs84_to_msl.
+    
+    Parameters
+    ----------
+    altitudes_wgs84 : array_like
+        Heights above WGS84 ellipsoid in meters
+    latitudes : array_like
+        Latitudes in degrees (-90 to 90)
+    longitudes : array_like
+        Longitudes in degrees (-180 to 180 or 0 to 360)
+        
+    Returns
+    -------
+    numpy.ndarray
+        Altitudes above Mean Sea Level in meters
+        
+    Examples
+    --------
+    >>> altitudes = wgs84_to_msl_array([47, 1047], [46.0, 46.0], [4.0, 4.0])
+    """
+    import numpy as np
+    
+    undulations = get_geoid_undulation_array(latitudes, longitudes)
+    return np.asarray(altitudes_wgs84, dtype=float) - undulations
+
+
 def clear_geoid_cache() -> None:
     """Clear the cached geoid model and undulation values.
     
-    This function clears both the geoid model cache and the LRU cache
-    used by get_geoid_undulation. Useful for testing or to force reloading
-    the geoid data.
+    This function clears the geoid model cache, the LRU cache used by
+    get_geoid_undulation and the persistent undulation cache of the current
+    data source. Useful for testing or to force reloading the geoid data.
     """
-    global _geoid_model
+    global _geoid_model, _geoid_spline
     _geoid_model = None
-    get_geoid_undulation.cache_clear()
+    _geoid_spline = None
+    _undulation_at_grid_node.cache_clear()
+    with _undulation_db_lock:
+        _pending_undulations.clear()
+        # Do not create a cache file just to empty it
+        if _undulation_db is None and not _undulation_db_path().exists():
+            return
+        conn = _get_undulation_db()
+        if conn is not None:
+            try:
+                with conn:
+                    conn.execute("DELETE FROM undulation")
+            except sqlite3.Error as e:
+                logger.warning("Failed to clear persistent geoid cache: %s", e)
@@ -303,6 +303,28 @@ function makeResizable(panel, minWidth = CONSTANTS.PANEL_MIN_WIDTH, minHeight =
   };
 }
 
+/**
+ * Apply a _measurement_delta to a list of measurement results
+ * @param {Array} results - Current measurement results
+ * @param {Object} delta - Delta with op "reset", "append", "update" or "clear"
+ * @returns {Array|null} New results, or null if the delta is invalid
+ */
+export function applyMeasurementDelta(results, delta) {
+  switch (delta.op) {
+    case "reset":
+      return [...(delta.items || [])];
+    case "append":
+      return [...results, delta.item];
+    case "update":
+      if (!(delta.index >= 0 && delta.index < results.length)) return null;
+      return results.map((r, i) => (i === delta.index ? delta.item : r));
+    case "clear":
+      return [];
+    default:
+      return null;
+  }
+}
+
 /**
  * Initialize measurement tools for a Cesium viewer
  * @param {Object} viewer - Cesium Viewer instance
@@ -337,6 +359,42 @@ export function initializeMeasurementTools(viewer, model, container) {
     addPointMode: false,
   };
 
+  // Measurement results are kept locally. Only per-operation deltas are
+  // synced (through _measurement_delta), so each change sends one item
+  // instead of the whole list. Python owns the full list: on render the
+  // view asks for it, and Python answers with a "reset" delta.
+  const viewId = `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+  let measurementResults = [];
+  let deltaSeq = 0;
+  let revSeq = 0;
+
+  function commitMeasurementDelta(newResults, delta) {
+    if (delta.item) {
+      // Give the item a new revision; an update names the one it replaces so
+      // Python can detect edits that raced with another view
+      const base = delta.item.rev;
+      delta.item.rev = `${viewId}:${++revSeq}`;
+      if (delta.op === "update") {
+        delta = { ...delta, base };
+      }
+    }
+    measurementResults = newResults;
+    model.set("_measurement_delta", { ...delta, view: viewId, seq: ++deltaSeq });
+    model.save_changes();
+    onMeasurementResultsChanged();
+  }
+
+  function onMeasurementDelta(delta) {
+    if (!delta || !delta.op || delta.view === viewId) return;
+    const newResults = applyMeasurementDelta(measurementResults, delta);
+    if (newResults === null) {
+      warn(PREFIX, 'Ignoring invalid measurement delta:', delta.op);
+      return;
+    }
+    measurementResults = newResults;
+    onMeasurementResultsChanged();
+  }
+
   // Store cleanup functions for event listeners
   const cleanupFunctions = [];
 
@@ -414,8 +472,7 @@ export function initializeMeasurementTools(viewer, model, container) {
   clearBtn.onclick = () => {
     clearAllMeasurements();
     model.set("measurement_mode", "");
-    model.set("measurement_results", []);
-    model.save_changes();
+    commitMeasurementDelta([], { op: "clear" });
   };
 
   Object.values(modeButtons).forEach(btn => toolbarContent.appendChild(btn));
@@ -621,26 +678,26 @@ export function initializeMeasurementTools(viewer, model, container) {
   }
 
   function updateOrCreateMeasurement(type, value, points) {
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     const lastResult = results[results.length - 1];
     const isActiveType = lastResult && lastResult.type === type && lastResult.isActive;
     
-    let newResults;
     if (isActiveType) {
-      newResults = [...results];
-      newResults[newResults.length - 1] = { ...lastResult, value, points };
+      const newResults = [...results];
+      const index = newResults.length - 1;
+      newResults[index] = { ...lastResult, value, points };
+      commitMeasurementDelta(newResults, { op: "update", index, item: newResults[index] });
     } else {
       const count = results.filter(r => r.type === type).length + 1;
-      newResults = [...results, {
+      const item = {
         type,
         value,
         points,
         isActive: type === 'multi-distance' || type === 'area',
         name: `${TYPE_LABELS[type]} ${count}`,
-      }];
+      };
+      commitMeasurementDelta([...results, item], { op: "append", item });
     }
-    model.set("measurement_results", newResults);
-    model.save_changes();
   }
 
   function clearAllMeasurements() {
@@ -763,7 +820,7 @@ export function initializeMeasurementTools(viewer, model, container) {
 
   function selectPoint(entity, screenPosition) {
     // Find which measurement and point this entity belongs to
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     let measurementIndex = -1;
     let pointIndex = -1;
 
@@ -906,7 +963,7 @@ export function initializeMeasurementTools(viewer, model, container) {
   }
 
   function updateMeasurementVisuals() {
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     if (editState.measurementIndex === null) return;
 
     const measurement = results[editState.measurementIndex];
@@ -994,7 +1051,7 @@ export function initializeMeasurementTools(viewer, model, container) {
   function finalizeMeasurementUpdate() {
     if (editState.measurementIndex === null || editState.pointIndex === null) return;
 
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     const measurement = results[editState.measurementIndex];
 
     // Update the point coordinates
@@ -1036,9 +1093,9 @@ export function initializeMeasurementTools(viewer, model, container) {
     }
 
     // Sync back to Python
-    const newResults = [...results];
-    model.set("measurement_results", newResults);
-    model.save_changes();
+    commitMeasurementDelta([...results], {
+      op: "update", index: editState.measurementIndex, item: measurement,
+    });
 
     // Update the measurements list
     updateMeasurementsList();
@@ -1056,7 +1113,7 @@ export function initializeMeasurementTools(viewer, model, container) {
       return;
     }
 
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     
     // Find the nearest line segment across all measurements
     let nearestMeasurement = null;
@@ -1148,7 +1205,7 @@ export function initializeMeasurementTools(viewer, model, container) {
   }
 
   function addPointToMeasurement(measurementIndex, insertIndex, position) {
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     const measurement = results[measurementIndex];
     
     // Convert position to lat/lon/alt
@@ -1207,9 +1264,7 @@ export function initializeMeasurementTools(viewer, model, container) {
     updateMeasurementVisualsForIndex(measurementIndex);
     
     // Sync to Python
-    const newResults = [...results];
-    model.set("measurement_results", newResults);
-    model.save_changes();
+    commitMeasurementDelta([...results], { op: "update", index: measurementIndex, item: measurement });
     
     // Update measurements list
     updateMeasurementsList();
@@ -1218,7 +1273,7 @@ export function initializeMeasurementTools(viewer, model, container) {
   }
 
   function updateMeasurementVisualsForIndex(measurementIndex) {
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     const measurement = results[measurementIndex];
 
     // Collect all entity positions for this measurement
@@ -1277,7 +1332,7 @@ export function initializeMeasurementTools(viewer, model, container) {
   // ============= MEASUREMENTS LIST FUNCTIONS =============
 
   function updateMeasurementsList() {
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     log(PREFIX, 'Updating measurements list, count:', results.length);
     const listContent = document.getElementById("measurements-list-content");
 
@@ -1378,17 +1433,15 @@ export function initializeMeasurementTools(viewer, model, container) {
   function renameMeasurement(index, currentName) {
     const newName = prompt('Enter new name for measurement:', currentName);
     if (newName && newName.trim()) {
-      const results = model.get("measurement_results") || [];
+      const results = measurementResults;
       const newResults = [...results];
       newResults[index] = { ...newResults[index], name: newName.trim() };
-      model.set("measurement_results", newResults);
-      model.save_changes();
-      updateMeasurementsList();
+      commitMeasurementDelta(newResults, { op: "update", index, item: newResults[index] });
     }
   }
 
   function focusOnMeasurement(index) {
-    const results = model.get("measurement_results") || [];
+    const results = measurementResults;
     if (index < 0 || index >= results.length) return;
 
     const measurement = results[index];
@@ -1457,15 +1510,14 @@ export function initializeMeasurementTools(viewer, model, container) {
       });
       measurementState.polylines.push(measurementState.polyline);
 
-      const results = model.get("measurement_results") || [];
-      const newResults = [...results, {
+      const results = measurementResults;
+      const item = {
         type: "distance",
         value: distance,
         points: measurementState.points.map(cartesianToLatLonAlt),
         name: `Distance ${results.filter(r => r.type === 'distance').length + 1}`,
-      }];
-      model.set("measurement_results", newResults);
-      model.save_changes();
+      };
+      commitMeasurementDelta([...results, item], { op: "append", item });
 
       measurementState.points = [];
     }
@@ -1534,15 +1586,14 @@ export function initializeMeasurementTools(viewer, model, container) {
     const midpoint = getMidpoint(groundPosition, pickedPosition);
     addLabel(midpoint, `${height.toFixed(2)} m`);
 
-    const results = model.get("measurement_results") || [];
-    const newResults = [...results, {
+    const results = measurementResults;
+    const item = {
       type: "height",
       value: height,
       points: [cartesianToLatLonAlt(groundPosition), cartesianToLatLonAlt(pickedPosition)],
       name: `Height ${results.filter(r => r.type === 'height').length + 1}`,
-    }];
-    model.set("measurement_results", newResults);
-    model.save_changes();
+    };
+    commitMeasurementDelta([...results, item], { op: "append", item });
   }
 
   function handleAreaClick(click) {
@@ -1625,14 +1676,14 @@ export function initializeMeasurementTools(viewer, model, container) {
       measurementHandler.setInputAction(handleMultiDistanceClick, Cesium.ScreenSpaceEventType.LEFT_CLICK);
       measurementHandler.setInputAction(() => {
         if (measurementState.points.length > 0) {
-          const results = model.get("measurement_results") || [];
+          const results = measurementResults;
           const lastResult = results[results.length - 1];
           if (lastResult && lastResult.isActive) {
             const newResults = [...results];
             const { isActive, ...finalResult } = lastResult;
-            newResults[newResults.length - 1] = finalResult;
-            model.set("measurement_results", newResults);
-            model.save_changes();
+            const index = newResults.length - 1;
+            newResults[index] = finalResult;
+            commitMeasurementDelta(newResults, { op: "update", index, item: finalResult });
           }
           measurementState.points = [];
         }
@@ -1643,14 +1694,14 @@ export function initializeMeasurementTools(viewer, model, container) {
       measurementHandler.setInputAction(handleAreaClick, Cesium.ScreenSpaceEventType.LEFT_CLICK);
       measurementHandler.setInputAction(() => {
         if (measurementState.points.length >= 3) {
-          const results = model.get("measurement_results") || [];
+          const results = measurementResults;
           const lastResult = results[results.length - 1];
           if (lastResult && lastResult.isActive) {
             const newResults = [...results];
             const { isActive, ...finalResult } = lastResult;
-            newResults[newResults.length - 1] = finalResult;
-            model.set("measurement_results", newResults);
-            model.save_changes();
+            const index = newResults.length - 1;
+            newResults[index] = finalResult;
+            commitMeasurementDelta(newResults, { op: "update", index, item: finalResult });
           }
           measurementState.points = [];
         }
@@ -1783,19 +1834,31 @@ export function initializeMeasurementTools(viewer, model, container) {
     enableMeasurementMode(mode);
   });
 
-  model.on("change:measurement_results", () => {
-    if (isDestroyed) {
-      log(PREFIX, 'Skipping measurement_results change - destroyed');
-      return;
-    }
-    const results = model.get("measurement_results") || [];
-    log(PREFIX, 'Measurement results changed, count:', results.length);
-    if (results.length === 0) {
+  function onMeasurementResultsChanged() {
+    log(PREFIX, 'Measurement results changed, count:', measurementResults.length);
+    if (measurementResults.length === 0) {
       clearAllMeasurements();
     }
     updateMeasurementsList();
+  }
+
+  model.on("change:_measurement_delta", () => {
+    if (isDestroyed) {
+      log(PREFIX, 'Skipping _measurement_delta change - destroyed');
+      return;
+    }
+    // Deltas made by this view are already applied locally
+    onMeasurementDelta(model.get("_measurement_delta"));
   });
 
+  // Seed from the last reset if there is one, then ask Python for the
+  // full list since later deltas only make sense on top of it
+  const initialDelta = model.get("_measurement_delta");
+  if (initialDelta && initialDelta.op === "reset") {
+    onMeasurementDelta(initialDelta);
+  }
+  model.send({ type: "measurement_sync_request" });
+
   model.on("change:load_measurements_trigger", () => {
     if (isDestroyed) return;
     const triggerData = model.get("load_measurements_trigger");
@@ -952,6 +952,58 @@ export function setupGeoJSONLoader(viewer, model, Cesium) {
   // Listen for changes to geojson_data
   model.on("change:geojson_data", () => loadGeoJSONData(true));
 
+  // Data sources filled incrementally by stream_geojson, keyed by stream id
+  let streamedDataSources = new Map();
+  let streamQueue = Promise.resolve();
+  const textDecoder = new TextDecoder();
+
+  function removeStreamedDataSources() {
+    streamedDataSources.forEach(dataSource => {
+      if (viewer && viewer.dataSources) {
+        viewer.dataSources.remove(dataSource);
+      }
+    });
+    streamedDataSources = new Map();
+  }
+
+  async function processGeoJSONChunk(msg, buffers) {
+    if (isDestroyed || !viewer || !viewer.dataSources) return;
+
+    let dataSource = streamedDataSources.get(msg.id);
+    if (!dataSource) {
+      dataSource = new Cesium.GeoJsonDataSource();
+      streamedDataSources.set(msg.id, dataSource);
+      viewer.dataSources.add(dataSource);
+    }
+
+    // Each chunk holds whole lines, one GeoJSON feature per line
+    const text = buffers && buffers.length > 0 ? textDecoder.decode(buffers[0]) : '';
+    const features = text.split('\n').filter(line => line.length > 0).map(line => JSON.parse(line));
+    log(PREFIX, `GeoJSON stream ${msg.id}: chunk ${msg.seq} with ${features.length} features`);
+    if (features.length > 0) {
+      // process() adds to the existing entities, unlike load() which replaces them
+      await dataSource.process({ type: "FeatureCollection", features }, {
+        stroke: Cesium.Color.HOTPINK,
+        fill: Cesium.Color.PINK.withAlpha(CONSTANTS.GEOJSON_FILL_ALPHA),
+        strokeWidth: CONSTANTS.GEOJSON_STROKE_WIDTH,
+      });
+    }
+    if (msg.final && !isDestroyed && viewer && viewer.flyTo) {
+      viewer.flyTo(dataSource);
+    }
+  }
+
+  model.on("msg:custom", (msg, buffers) => {
+    if (msg.type === "geojson_chunk") {
+      // Chain chunks so they are processed in order
+      streamQueue = streamQueue
+        .then(() => processGeoJSONChunk(msg, buffers))
+        .catch(err => error(PREFIX, "Error loading streamed GeoJSON:", err));
+    } else if (msg.type === "geojson_clear_streams") {
+      streamQueue = streamQueue.then(removeStreamedDataSources);
+    }
+  });
+
   // Load any initial GeoJSON data
   const initialData = model.get("geojson_data");
   if (initialData && Array.isArray(initialData) && initialData.length > 0) {
@@ -969,6 +1021,7 @@ export function setupGeoJSONLoader(viewer, model, Cesium) {
         }
       });
       geojsonDataSources = [];
+      removeStreamedDataSources();
     }
   };
 }
@@ -3,6 +3,15 @@
 import logging
 import sys
 
+# One console handler and formatter shared by every package logger
+_FORMATTER = logging.Formatter('%(levelname)s - %(name)s - %(message)s')
+_HANDLER = logging.StreamHandler(sys.stdout)
+_HANDLER.setLevel(logging.DEBUG)
+_HANDLER.setFormatter(_FORMATTER)
+
+# Loggers already configured by get_logger, keyed by name
+_LOGGER_CACHE: dict[str, logging.Logger] = {}
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get a configured logger instance.
@@ -23,26 +32,24 @@ def get_logger(name: str) -> logging.Logger:
     >>> logger = get_logger(__name__)
     >>> logger.info("This is an info message")
     """
+    cached = _LOGGER_CACHE.get(name)
+    if cached is not None:
+        return cached
+
     logger = logging.getLogger(name)
-    
+
     # Only configure if this logger hasn't been configured yet
     if not logger.handlers:
         # Set default level to INFO
         logger.setLevel(logging.INFO)
         
-        # Create console handler
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(logging.DEBUG)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(levelname)s - %(name)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
+        # Attach the shared console handler
+        logger.addHandler(_HANDLER)
         
-        # Add handler to logger
-        logger.addHandler(handler)
-    
+        # The handler above already prints; don't repeat through root handlers
+        logger.propagate = False
+
+    _LOGGER_CACHE[name] = logger
     return logger
 
 
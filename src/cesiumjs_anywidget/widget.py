@@ -1,13 +1,125 @@
 """CesiumJS widget implementation using anywidget."""
 
+import itertools
+import json
 import os
 import pathlib
 import anywidget
 import traitlets
 from .logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional: fall back to the standard library
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Directory holding the bundled front-end assets
+_ASSET_DIR = pathlib.Path(__file__).parent
+
+
+def _json_loads(text):
+    """Parse a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # Let the standard library handle what orjson rejects (e.g. NaN)
+            pass
+    return json.loads(text)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize an object to compact UTF-8 JSON, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Target size of the NDJSON chunks sent by stream_geojson
+_GEOJSON_CHUNK_BYTES = 256 * 1024
+
+# Warning shown (once per session) when no Cesium Ion token is available
+_MISSING_TOKEN_MESSAGE = (
+    "No Cesium Ion access token provided.\n"
+    "Your access token can be found at: https://ion.cesium.com/tokens\n"
+    "You can set it via:\n"
+    "  - CesiumWidget(ion_access_token='your_token')\n"
+    "  - export CESIUM_ION_TOKEN='your_token'  # in your shell\n"
+    "Note: Some features may not work without a token."
+)
+_warned_missing_token = False
+
+# Modes accepted by enable_measurement
+_VALID_MEASUREMENT_MODES = frozenset({"distance", "multi-distance", "height", "area"})
+
+# Keyword argument -> settings key for set_atmosphere / set_sky_atmosphere
+_ATMOSPHERE_KEYS = {
+    "brightness_shift": "brightnessShift",
+    "hue_shift": "hueShift",
+    "saturation_shift": "saturationShift",
+    "light_intensity": "lightIntensity",
+    "rayleigh_coefficient": "rayleighCoefficient",
+    "rayleigh_scale_height": "rayleighScaleHeight",
+    "mie_coefficient": "mieCoefficient",
+    "mie_scale_height": "mieScaleHeight",
+    "mie_anisotropy": "mieAnisotropy",
+}
+_SKY_ATMOSPHERE_KEYS = {
+    "show": "show",
+    "brightness_shift": "brightnessShift",
+    "hue_shift": "hueShift",
+    "saturation_shift": "saturationShift",
+    "light_intensity": "atmosphereLightIntensity",
+    "rayleigh_coefficient": "atmosphereRayleighCoefficient",
+    "rayleigh_scale_height": "atmosphereRayleighScaleHeight",
+    "mie_coefficient": "atmosphereMieCoefficient",
+    "mie_scale_height": "atmosphereMieScaleHeight",
+    "mie_anisotropy": "atmosphereMieAnisotropy",
+    "per_fragment_atmosphere": "perFragmentAtmosphere",
+}
+# Arguments that must be 3-component vectors
+_VEC3_ARGS = frozenset({"rayleigh_coefficient", "mie_coefficient"})
+
+
+def _settings_from_args(keys, args):
+    """Map the non-None keyword arguments in ``args`` to settings keys.
+
+    Parameters
+    ----------
+    keys : dict
+        Keyword argument name -> settings key.
+    args : dict
+        Keyword argument values, typically the caller's ``locals()``.
+
+    Returns
+    -------
+    dict
+        Settings dictionary to assign to the widget trait.
+    """
+    settings = {}
+    for name, key in keys.items():
+        value = args[name]
+        if value is None:
+            continue
+        if name in _VEC3_ARGS:
+            if len(value) != 3:
+                raise ValueError(f"{name} must be a tuple of 3 floats")
+            value = list(value)
+        settings[key] = value
+    return settings
+
+
+# Faces required by set_skybox sources
+_CUBE_MAP_FACES = frozenset(
+    {"positiveX", "negativeX", "positiveY", "negativeY", "positiveZ", "negativeZ"}
+)
+
+# Sequence numbers that make each trigger payload unique, so that repeated
+# commands are always seen as a change (timestamps can collide)
+_trigger_sequence = itertools.count(1)
+
 
 class CesiumWidget(anywidget.AnyWidget):
     """A Jupyter widget for CesiumJS 3D globe visualization.
@@ -38,11 +150,13 @@ class CesiumWidget(anywidget.AnyWidget):
     # Load JavaScript and CSS from files.
     # index.css is generated by the build (contains bundled Cesium widget styles).
     # styles.css contains widget-specific overrides.
-    _esm = pathlib.Path(__file__).parent / "index.js"
+    # anywidget reads and caches _esm once per class (and hot-reloads it in
+    # development), so it stays a path; the CSS is concatenated once at import
+    _esm = _ASSET_DIR / "index.js"
     _css = (
-        (pathlib.Path(__file__).parent / "index.css").read_text(encoding="utf-8")
+        (_ASSET_DIR / "index.css").read_text(encoding="utf-8")
         + "\n"
-        + (pathlib.Path(__file__).parent / "styles.css").read_text(encoding="utf-8")
+        + (_ASSET_DIR / "styles.css").read_text(encoding="utf-8")
     )
 
     # Camera position properties (synced with JavaScript)
@@ -106,8 +220,9 @@ class CesiumWidget(anywidget.AnyWidget):
     ).tag(sync=True)
 
     # CZML data for visualization (list of CZML documents)
+    # Packets are validated once in load_czml: per-element trait validation
+    # would re-walk every packet of every document on each assignment
     czml_data = traitlets.List(
-        trait=traitlets.List(trait=traitlets.Dict()),
         default_value=[],
         help="List of CZML documents to display",
     ).tag(sync=True)
@@ -179,9 +294,21 @@ class CesiumWidget(anywidget.AnyWidget):
         "",
         help="Active measurement mode: 'distance', 'multi-distance', 'height', or '' for none",
     ).tag(sync=True)
+    # Not synced: views send one delta per change through _measurement_delta
+    # instead of the whole list. "append" adds an item, "update" replaces the
+    # item at "index" and "clear" empties the list. Each item carries a "rev"
+    # token that changes on every edit, and an update names the token it was
+    # based on, so an update to an element that has since changed is answered
+    # with a "reset" holding the whole list. Python also sends a "reset" when
+    # it replaces the list or when a new view asks for it.
     measurement_results = traitlets.List(
-        trait=traitlets.Dict(), default_value=[], help="List of measurement results"
+        default_value=[], help="List of measurement results (dicts)"
+    )
+    _measurement_delta = traitlets.Dict(
+        default_value={},
+        help="Last change to measurement_results: append, update, clear or reset",
     ).tag(sync=True)
+    _applying_measurement_delta = False
     load_measurements_trigger = traitlets.Dict(
         default_value={}, help="Trigger to load measurements with visual display"
     ).tag(sync=True)
@@ -233,20 +360,27 @@ class CesiumWidget(anywidget.AnyWidget):
 
         Automatically checks for CESIUM_ION_TOKEN environment variable if no token is provided.
         """
-        # Check for token in environment variable if not provided
-        if "ion_access_token" not in kwargs or not kwargs["ion_access_token"]:
+        global _warned_missing_token
+
+        # Check for token in environment variable if not provided. The
+        # variable is read on each call so tokens set after import still apply.
+        if not kwargs.get("ion_access_token"):
             env_token = os.environ.get("CESIUM_ION_TOKEN", "")
             if env_token:
                 kwargs["ion_access_token"] = env_token
-            else:
-                logger.warning("No Cesium Ion access token provided.")
-                logger.warning("Your access token can be found at: https://ion.cesium.com/tokens")
-                logger.warning("You can set it via:")
-                logger.warning("  - CesiumWidget(ion_access_token='your_token')")
-                logger.warning("  - export CESIUM_ION_TOKEN='your_token'  # in your shell")
-                logger.warning("Note: Some features may not work without a token.")
+            elif not _warned_missing_token:
+                # Warn once per session rather than for every widget
+                _warned_missing_token = True
+                logger.warning(_MISSING_TOKEN_MESSAGE)
 
         super().__init__(**kwargs)
+        self.on_msg(self._handle_custom_msg)
+
+    def _handle_custom_msg(self, widget, content, buffers):
+        """Handle custom messages sent by the viewer."""
+        if content.get("type") == "measurement_sync_request":
+            # A new view has no measurements yet: send it the full list
+            self._reset_viewer_measurements()
 
     def request_render(self):
         """Request a frame render explicitly when request_render_mode is enabled."""
@@ -807,8 +941,7 @@ class CesiumWidget(anywidget.AnyWidget):
         >>> widget.load_geojson(geojson2, append=True)  # Adds to existing data
         """
         if isinstance(geojson, str):
-            import json
-            geojson = json.loads(geojson)
+            geojson = _json_loads(geojson)
         
         if append:
             # Append to existing list
@@ -819,6 +952,57 @@ class CesiumWidget(anywidget.AnyWidget):
             # Replace existing data
             self.geojson_data = [geojson]
     
+    def stream_geojson(self, geojson, chunk_size: int = _GEOJSON_CHUNK_BYTES):
+        """Stream a large GeoJSON dataset to the viewer in chunks.
+
+        Features are encoded as newline-delimited JSON (one feature per line)
+        and sent as binary message buffers of about ``chunk_size`` bytes. The
+        viewer adds each chunk as it arrives, instead of receiving and parsing
+        the whole FeatureCollection in a single synced trait update.
+
+        Streamed data is not part of ``geojson_data``: it is only shown by
+        views that are already displayed, and it is removed by
+        clear_geojson().
+
+        Parameters
+        ----------
+        geojson : dict or str
+            GeoJSON FeatureCollection, Feature or geometry, or its JSON string
+        chunk_size : int, optional
+            Approximate size in bytes of each chunk (default: 256 KB)
+
+        Examples
+        --------
+        >>> widget = CesiumWidget()
+        >>> widget  # display the widget first
+        >>> widget.stream_geojson(large_feature_collection)
+        """
+        if isinstance(geojson, str):
+            geojson = _json_loads(geojson)
+        if geojson.get("type") == "FeatureCollection":
+            features = geojson.get("features", [])
+        else:
+            features = [geojson]
+
+        stream_id = next(_trigger_sequence)
+        seq = 0
+        lines, size = [], 0
+        for feature in features:
+            line = _json_dumps(feature) + b"\n"
+            lines.append(line)
+            size += len(line)
+            if size >= chunk_size:
+                self.send(
+                    {"type": "geojson_chunk", "id": stream_id, "seq": seq, "final": False},
+                    buffers=[b"".join(lines)],
+                )
+                seq += 1
+                lines, size = [], 0
+        self.send(
+            {"type": "geojson_chunk", "id": stream_id, "seq": seq, "final": True},
+            buffers=[b"".join(lines)],
+        )
+
     def clear_geojson(self):
         """Clear all GeoJSON data from the viewer.
         
@@ -827,6 +1011,8 @@ class CesiumWidget(anywidget.AnyWidget):
         >>> widget.clear_geojson()
         """
         self.geojson_data = []
+        # Also remove any data added by stream_geojson
+        self.send({"type": "geojson_clear_streams"})
 
     def load_czml(self, czml: str | list, append=False):
         """Load CZML data for visualization.
@@ -864,11 +1050,9 @@ class CesiumWidget(anywidget.AnyWidget):
         >>> widget.load_czml(czml_doc2, append=True)  # Adds to existing data
         >>> widget.load_czml(new_czml, clear_existing=True)
         """
-        import json
-
         # Handle string input (JSON)
         if isinstance(czml, str):
-            czml = json.loads(czml)
+            czml = _json_loads(czml)
 
         # Ensure we have a list
         if not isinstance(czml, list):
@@ -877,6 +1061,8 @@ class CesiumWidget(anywidget.AnyWidget):
         # Validate basic structure - should have at least one packet
         if len(czml) == 0:
             raise ValueError("CZML document must contain at least one packet")
+        if not all(isinstance(packet, dict) for packet in czml):
+            raise ValueError("CZML packets must be dictionaries")
 
         if append:
             # Append to existing list
@@ -950,9 +1136,10 @@ class CesiumWidget(anywidget.AnyWidget):
             - 'area': Polygon area measurement
             Default: 'distance'
         """
-        valid_modes = ["distance", "multi-distance", "height", "area"]
-        if mode not in valid_modes:
-            raise ValueError(f"Invalid mode '{mode}'. Must be one of {valid_modes}")
+        if mode not in _VALID_MEASUREMENT_MODES:
+            raise ValueError(
+                f"Invalid mode '{mode}'. Must be one of {sorted(_VALID_MEASUREMENT_MODES)}"
+            )
         self.measurement_mode = mode
 
     def disable_measurement(self):
@@ -966,17 +1153,65 @@ class CesiumWidget(anywidget.AnyWidget):
         Returns
         -------
         list of dict
-            List of measurement results, each containing:
+            Snapshot of the measurement results, each containing:
             - type: measurement type ('distance', 'multi-distance', 'height', or 'area')
             - value: measured value in meters (or square meters for area)
             - points: list of {lat, lon, alt} coordinates
+
+            The list is a copy: changing it does not affect the widget. Assign
+            to ``measurement_results`` to replace the results.
         """
-        return self.measurement_results
+        return list(self.measurement_results)
 
     def clear_measurements(self):
         """Clear all measurements from the viewer."""
         self.measurement_results = []
 
+    @traitlets.observe("_measurement_delta")
+    def _apply_measurement_delta(self, change):
+        """Apply a change made in the viewer to measurement_results."""
+        delta = change["new"]
+        op = delta.get("op")
+        if not op or op == "reset":
+            return  # Sent by Python itself
+
+        results = list(self.measurement_results)
+        if op == "append":
+            results.append(delta["item"])
+        elif op == "update":
+            index = delta.get("index", -1)
+            if not (0 <= index < len(results)) or results[index].get("rev") != delta.get("base"):
+                # The view edited an element that has since changed or gone,
+                # e.g. another view updated it first: resync every view
+                self._reset_viewer_measurements()
+                return
+            results[index] = delta["item"]
+        elif op == "clear":
+            results = []
+        else:
+            logger.warning("Ignoring invalid measurement delta: %s", op)
+            return
+
+        self._applying_measurement_delta = True
+        try:
+            self.measurement_results = results
+        finally:
+            self._applying_measurement_delta = False
+
+    @traitlets.observe("measurement_results")
+    def _send_measurement_reset(self, change):
+        """Send the whole list to the viewer when Python replaces it."""
+        if not self._applying_measurement_delta:
+            self._reset_viewer_measurements()
+
+    def _reset_viewer_measurements(self):
+        """Replace the measurements of every view with measurement_results."""
+        self._measurement_delta = {
+            "op": "reset",
+            "items": list(self.measurement_results),
+            "seq": next(_trigger_sequence),
+        }
+
     def load_measurements(self, measurements):
         """Load and display measurements on the map.
 
@@ -1000,14 +1235,30 @@ class CesiumWidget(anywidget.AnyWidget):
         ...     }
         ... ])
         """
-        import time
-
-        # Send measurements with a timestamp to trigger the change detection
+        # Send measurements with a sequence number to trigger the change detection
         self.load_measurements_trigger = {
             "measurements": measurements,
-            "timestamp": time.time(),
+            "seq": next(_trigger_sequence),
         }
 
+    def add_measurements(self, batches):
+        """Load and display several batches of measurements at once.
+
+        All batches are sent to the viewer in a single sync message, instead
+        of one message per load_measurements call.
+
+        Parameters
+        ----------
+        batches : list of list of dict
+            Batches of measurements, each in the format accepted by
+            load_measurements
+
+        Examples
+        --------
+        >>> widget.add_measurements([distances, areas])
+        """
+        self.load_measurements([m for batch in batches for m in batch])
+
     def focus_on_measurement(self, index : int):
         """Focus the camera on a specific measurement by index.
 
@@ -1021,9 +1272,7 @@ class CesiumWidget(anywidget.AnyWidget):
         >>> widget.focus_on_measurement(0)  # Focus on first measurement
         >>> widget.focus_on_measurement(2)  # Focus on third measurement
         """
-        import time
-
-        self.focus_measurement_trigger = {"index": index, "timestamp": time.time()}
+        self.focus_measurement_trigger = {"index": index, "seq": next(_trigger_sequence)}
 
     def show_tools(self):
         """Show the measurement tools toolbar."""
@@ -1144,32 +1393,7 @@ class CesiumWidget(anywidget.AnyWidget):
         Reset to defaults:
         >>> widget.set_atmosphere(brightness_shift=0, hue_shift=0, saturation_shift=0)
         """
-        settings = {}
-        
-        if brightness_shift is not None:
-            settings['brightnessShift'] = brightness_shift
-        if hue_shift is not None:
-            settings['hueShift'] = hue_shift
-        if saturation_shift is not None:
-            settings['saturationShift'] = saturation_shift
-        if light_intensity is not None:
-            settings['lightIntensity'] = light_intensity
-        if rayleigh_coefficient is not None:
-            if len(rayleigh_coefficient) != 3:
-                raise ValueError("rayleigh_coefficient must be a tuple of 3 floats")
-            settings['rayleighCoefficient'] = list(rayleigh_coefficient)
-        if rayleigh_scale_height is not None:
-            settings['rayleighScaleHeight'] = rayleigh_scale_height
-        if mie_coefficient is not None:
-            if len(mie_coefficient) != 3:
-                raise ValueError("mie_coefficient must be a tuple of 3 floats")
-            settings['mieCoefficient'] = list(mie_coefficient)
-        if mie_scale_height is not None:
-            settings['mieScaleHeight'] = mie_scale_height
-        if mie_anisotropy is not None:
-            settings['mieAnisotropy'] = mie_anisotropy
-            
-        self.atmosphere_settings = settings
+        self.atmosphere_settings = _settings_from_args(_ATMOSPHERE_KEYS, locals())
 
     def set_sky_atmosphere(self,
                           show=None,
@@ -1233,36 +1457,7 @@ class CesiumWidget(anywidget.AnyWidget):
         Reset:
         >>> widget.sky_atmosphere_settings = {}
         """
-        settings = {}
-        
-        if show is not None:
-            settings['show'] = show
-        if brightness_shift is not None:
-            settings['brightnessShift'] = brightness_shift
-        if hue_shift is not None:
-            settings['hueShift'] = hue_shift
-        if saturation_shift is not None:
-            settings['saturationShift'] = saturation_shift
-        if light_intensity is not None:
-            settings['atmosphereLightIntensity'] = light_intensity
-        if rayleigh_coefficient is not None:
-            if len(rayleigh_coefficient) != 3:
-                raise ValueError("rayleigh_coefficient must be a tuple of 3 floats")
-            settings['atmosphereRayleighCoefficient'] = list(rayleigh_coefficient)
-        if rayleigh_scale_height is not None:
-            settings['atmosphereRayleighScaleHeight'] = rayleigh_scale_height
-        if mie_coefficient is not None:
-            if len(mie_coefficient) != 3:
-                raise ValueError("mie_coefficient must be a tuple of 3 floats")
-            settings['atmosphereMieCoefficient'] = list(mie_coefficient)
-        if mie_scale_height is not None:
-            settings['atmosphereMieScaleHeight'] = mie_scale_height
-        if mie_anisotropy is not None:
-            settings['atmosphereMieAnisotropy'] = mie_anisotropy
-        if per_fragment_atmosphere is not None:
-            settings['perFragmentAtmosphere'] = per_fragment_atmosphere
-            
-        self.sky_atmosphere_settings = settings
+        self.sky_atmosphere_settings = _settings_from_args(_SKY_ATMOSPHERE_KEYS, locals())
 
     def set_skybox(self,
                   show=None,
@@ -1313,11 +1508,8 @@ class CesiumWidget(anywidget.AnyWidget):
                 raise ValueError("sources must be a dictionary with cube map face URLs")
             
             # Validate that all required faces are provided if sources is given
-            required_faces = {'positiveX', 'negativeX', 'positiveY', 'negativeY', 'positiveZ', 'negativeZ'}
-            provided_faces = set(sources.keys())
-            
-            if provided_faces and not required_faces.issubset(provided_faces):
-                missing = required_faces - provided_faces
+            if sources and not _CUBE_MAP_FACES <= sources.keys():
+                missing = sorted(_CUBE_MAP_FACES - sources.keys())
                 raise ValueError(f"sources must include all cube map faces. Missing: {missing}")
             
             settings['sources'] = sources
@@ -1380,8 +1572,8 @@ class CesiumWidget(anywidget.AnyWidget):
         emit("Anywidget version: %s", anywidget.__version__)
 
         # Check file paths (note: after widget instantiation, _esm and _css contain file contents)
-        esm_path = pathlib.Path(__file__).parent / "index.js"
-        css_path = pathlib.Path(__file__).parent / "styles.css"
+        esm_path = _ASSET_DIR / "index.js"
+        css_path = _ASSET_DIR / "styles.css"
 
         emit("JavaScript file:")
         emit("  Path: %s", esm_path)
@@ -1,8 +1,51 @@
 """Test configuration and fixtures for cesiumjs_anywidget tests."""
 
-import pytest
+import json
 import pathlib
 
+import pytest
+
+
+_SAMPLE_GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [-74.0060, 40.7128]
+            },
+            "properties": {
+                "name": "Test Point",
+                "description": "A test point"
+            }
+        },
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[
+                    [-74.05, 40.70],
+                    [-73.95, 40.70],
+                    [-73.95, 40.75],
+                    [-74.05, 40.75],
+                    [-74.05, 40.70]
+                ]]
+            },
+            "properties": {
+                "name": "Test Polygon"
+            }
+        }
+    ]
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _package_importable():
+    """Fail fast if the package under test cannot be imported."""
+    import cesiumjs_anywidget
+    assert cesiumjs_anywidget.CesiumWidget is not None
+
 
 @pytest.fixture
 def widget_class():
@@ -17,6 +60,13 @@ def widget_instance(widget_class):
     return widget_class()
 
 
+@pytest.fixture(scope="session")
+def readonly_widget():
+    """Create one CesiumWidget shared by tests that never mutate it."""
+    from cesiumjs_anywidget import CesiumWidget
+    return CesiumWidget()
+
+
 @pytest.fixture
 def widget_with_config(widget_class):
     """Create a CesiumWidget with custom configuration."""
@@ -32,38 +82,73 @@ def widget_with_config(widget_class):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_geojson():
-    """Return sample GeoJSON data for testing."""
+    """Return sample GeoJSON data for testing.
+
+    The same object is shared by every test; treat it as read-only.
+    """
+    return _SAMPLE_GEOJSON
+
+
+@pytest.fixture(scope="session")
+def sample_geojson_str(sample_geojson):
+    """Return sample_geojson serialized to a JSON string."""
+    return json.dumps(sample_geojson)
+
+
+@pytest.fixture(scope="session")
+def geojson_point():
+    """Return a single Point feature."""
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            "coordinates": [-74.0060, 40.7128]
+        },
+        "properties": {"name": "Test"}
+    }
+
+
+@pytest.fixture(scope="session")
+def geojson_polygon():
+    """Return a single Polygon feature."""
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [0, 0], [1, 0], [1, 1], [0, 1], [0, 0]
+            ]]
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def geojson_linestring():
+    """Return a single LineString feature."""
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "LineString",
+            "coordinates": [[0, 0], [1, 1], [2, 2]]
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def geojson_feature_collection():
+    """Return a FeatureCollection with two points."""
     return {
         "type": "FeatureCollection",
         "features": [
             {
                 "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    "coordinates": [-74.0060, 40.7128]
-                },
-                "properties": {
-                    "name": "Test Point",
-                    "description": "A test point"
-                }
+                "geometry": {"type": "Point", "coordinates": [0, 0]}
             },
             {
                 "type": "Feature",
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": [[
-                        [-74.05, 40.70],
-                        [-73.95, 40.70],
-                        [-73.95, 40.75],
-                        [-74.05, 40.75],
-                        [-74.05, 40.70]
-                    ]]
-                },
-                "properties": {
-                    "name": "Test Polygon"
-                }
+                "geometry": {"type": "Point", "coordinates": [1, 1]}
             }
         ]
     }
@@ -2,6 +2,7 @@
  * Tests for measurement tools module
  */
 import { jest, describe, it, beforeEach, afterEach, expect } from '@jest/globals';
+import { applyMeasurementDelta } from '../../src/cesiumjs_anywidget/js/measurement-tools.js';
 
 describe('Measurement Tools Module', () => {
   let mockContainer;
@@ -291,23 +292,34 @@ describe('Measurement Tools Module', () => {
       expect(mockContainer.contains(tools.listPanel)).toBe(true);
     });
 
-    it('should setup model listeners', () => {
-      const listeners = {};
-      mockModel.on = jest.fn((event, callback) => {
-        listeners[event] = callback;
-      });
+  });
 
-      const initializeMeasurementTools = (viewer, model, container) => {
-        model.on('change:measurement_mode', () => {});
-        model.on('change:measurement_results', () => {});
-        model.on('change:show_measurement_tools', () => {});
-      };
+  describe('applyMeasurementDelta', () => {
+    const first = { type: 'distance', value: 100 };
+    const second = { type: 'height', value: 50 };
 
-      initializeMeasurementTools(mockViewer, mockModel, mockContainer);
-      
-      expect(mockModel.on).toHaveBeenCalledWith('change:measurement_mode', expect.any(Function));
-      expect(mockModel.on).toHaveBeenCalledWith('change:measurement_results', expect.any(Function));
-      expect(mockModel.on).toHaveBeenCalledWith('change:show_measurement_tools', expect.any(Function));
+    it('should seed results from a reset _measurement_delta', () => {
+      const delta = { op: 'reset', items: [first, second], seq: 1 };
+      const results = applyMeasurementDelta([], delta);
+      expect(results).toEqual([first, second]);
+      expect(results).not.toBe(delta.items);
+    });
+
+    it('should apply append, update and clear deltas', () => {
+      let results = applyMeasurementDelta([], { op: 'append', item: first });
+      results = applyMeasurementDelta(results, { op: 'append', item: second });
+      expect(results).toEqual([first, second]);
+
+      const renamed = { ...first, name: 'Renamed' };
+      results = applyMeasurementDelta(results, { op: 'update', index: 0, item: renamed });
+      expect(results).toEqual([renamed, second]);
+
+      expect(applyMeasurementDelta(results, { op: 'clear' })).toEqual([]);
+    });
+
+    it('should reject out-of-range updates and unknown ops', () => {
+      expect(applyMeasurementDelta([first], { op: 'update', index: 1, item: second })).toBeNull();
+      expect(applyMeasurementDelta([first], { op: 'bogus' })).toBeNull();
     });
   });
 });
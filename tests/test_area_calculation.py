@@ -8,82 +8,121 @@ geometry instead of the previous flat-earth approximation.
 
 import math
 
+import numpy as np
+
+try:
+    from numba import njit, vectorize
+except ImportError:  # numba is optional: fall back to plain Python
+    vectorize = None
+    
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+DEG_TO_RAD = math.pi / 180.0
+EARTH_RADIUS = 6371000  # Earth radius in meters
+METERS_PER_DEGREE = 111320  # Length of one degree of latitude in meters
+
 def old_area_calculation(points):
     """Old incorrect area calculation using flat approximation."""
-    area = 0
-    for i in range(len(points)):
-        lon1, lat1 = points[i]
-        lon2, lat2 = points[(i + 1) % len(points)]
-        area += (lon1 * lat2 - lon2 * lat1)
+    # Pair each vertex with the next one, wrapping around to close the polygon
+    next_points = points[1:] + points[:1]
+    area = sum(
+        lon1 * lat2 - lon2 * lat1
+        for (lon1, lat1), (lon2, lat2) in zip(points, next_points)
+    )
     
     area = abs(area / 2)
-    meters_per_degree = 111320
+    meters_per_degree = METERS_PER_DEGREE
     return area * meters_per_degree * meters_per_degree
 
+@njit(cache=True, fastmath=True)
 def haversine_distance(lat1, lon1, lat2, lon2):
     """Calculate distance between two points using haversine formula."""
-    R = 6371000  # Earth radius in meters
+    R = EARTH_RADIUS
     
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
+    lat1_rad = lat1 * DEG_TO_RAD
+    lat2_rad = lat2 * DEG_TO_RAD
+    dlat = (lat2 - lat1) * DEG_TO_RAD
+    dlon = (lon2 - lon1) * DEG_TO_RAD
     
     a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
     c = 2 * math.asin(math.sqrt(a))
     
     return R * c
 
+# Element-wise haversine over whole arrays of point pairs, spread over all
+# cores with numba (the scalar version above is used inside other kernels)
+if vectorize is not None:
+    haversine_distance_array = vectorize(
+        ["float64(float64, float64, float64, float64)"],
+        target="parallel", fastmath=True, cache=True,
+    )(haversine_distance.py_func)
+else:
+    haversine_distance_array = np.vectorize(haversine_distance, otypes=[np.float64])
+
+@njit(cache=True, fastmath=True)
+def _triangle_area(pts):
+    """Area of a spherical triangle from its excess (L'Huilier's theorem)."""
+    R = EARTH_RADIUS
+    
+    # Calculate great circle distances
+    lon1, lat1 = pts[0, 0], pts[0, 1]
+    lon2, lat2 = pts[1, 0], pts[1, 1]
+    lon3, lat3 = pts[2, 0], pts[2, 1]
+    
+    a = haversine_distance(lat1, lon1, lat2, lon2) / R
+    b = haversine_distance(lat2, lon2, lat3, lon3) / R
+    c = haversine_distance(lat3, lon3, lat1, lon1) / R
+    
+    s = (a + b + c) / 2  # semi-perimeter
+    
+    # L'Huilier's formula for spherical excess
+    tan_E_4 = math.sqrt(
+        math.tan(s/2) * 
+        math.tan((s-a)/2) * 
+        math.tan((s-b)/2) * 
+        math.tan((s-c)/2)
+    )
+    E = 4 * math.atan(tan_E_4)
+    
+    return E * R * R
+
+@njit(cache=True, fastmath=True)
+def _polygon_area(pts):
+    """Polygon area from the shoelace formula with latitude correction."""
+    lon1, lat1 = pts[:, 0], pts[:, 1]
+    # Next vertex of each edge, wrapping around to close the polygon
+    lon2, lat2 = np.roll(lon1, -1), np.roll(lat1, -1)
+    
+    # Cosine of latitude computed once per vertex (N trig calls instead of 2N + 1)
+    cos_vertex = np.cos(lat1 * DEG_TO_RAD)
+    
+    # Average of the edge end points for better approximation
+    cos_lat = 0.5 * (cos_vertex + np.roll(cos_vertex, -1))
+    
+    # Shoelace formula with latitude correction
+    total_area = np.sum((lon1 * lat2 - lon2 * lat1) * cos_lat)
+    
+    total_area = abs(total_area / 2)
+    meters_per_degree_lon = METERS_PER_DEGREE * cos_vertex.mean()
+    meters_per_degree_lat = METERS_PER_DEGREE
+    
+    return total_area * meters_per_degree_lon * meters_per_degree_lat
+
 def spherical_excess_area(points):
     """
     Approximate area using spherical excess (L'Huilier's theorem).
     This is a better approximation than the old flat-earth method.
     """
-    R = 6371000  # Earth radius in meters
+    pts = np.asarray(points, dtype=np.float64)
     
     # For a simple triangle, use L'Huilier's formula
-    # For polygons, we triangulate and sum
-    if len(points) == 3:
-        # Calculate great circle distances
-        lon1, lat1 = points[0]
-        lon2, lat2 = points[1]
-        lon3, lat3 = points[2]
-        
-        a = haversine_distance(lat1, lon1, lat2, lon2) / R
-        b = haversine_distance(lat2, lon2, lat3, lon3) / R
-        c = haversine_distance(lat3, lon3, lat1, lon1) / R
-        
-        s = (a + b + c) / 2  # semi-perimeter
-        
-        # L'Huilier's formula for spherical excess
-        tan_E_4 = math.sqrt(
-            math.tan(s/2) * 
-            math.tan((s-a)/2) * 
-            math.tan((s-b)/2) * 
-            math.tan((s-c)/2)
-        )
-        E = 4 * math.atan(tan_E_4)
-        
-        return E * R * R
-    
     # For larger polygons, approximate using shoelace formula with latitude correction
-    total_area = 0
-    for i in range(len(points)):
-        lon1, lat1 = points[i]
-        lon2, lat2 = points[(i + 1) % len(points)]
-        
-        # Average latitude for better approximation
-        avg_lat = (lat1 + lat2) / 2
-        cos_lat = math.cos(math.radians(avg_lat))
-        
-        # Shoelace formula with latitude correction
-        total_area += (lon1 * lat2 - lon2 * lat1) * cos_lat
-    
-    total_area = abs(total_area / 2)
-    meters_per_degree_lon = 111320 * math.cos(math.radians(sum(p[1] for p in points) / len(points)))
-    meters_per_degree_lat = 111320
-    
-    return total_area * meters_per_degree_lon * meters_per_degree_lat
+    if len(pts) == 3:
+        return _triangle_area(pts)
+    return _polygon_area(pts)
 
 # Test cases
 print("Area Calculation Comparison")
@@ -135,6 +174,13 @@ new_result = spherical_excess_area(triangle)
 print(f"  Old calculation: {old_result:,.2f} m² ({old_result/1e6:.4f} km²)")
 print(f"  New calculation: {new_result:,.2f} m² ({new_result/1e6:.4f} km²)")
 
+# Test 4: Batched distances
+print("\nTest 4: Triangle side lengths computed in one batched call")
+tri = np.asarray(triangle)
+tri_next = np.roll(tri, -1, axis=0)
+sides = haversine_distance_array(tri[:, 1], tri[:, 0], tri_next[:, 1], tri_next[:, 0])
+print(f"  Side lengths: {', '.join(f'{d:,.1f} m' for d in sides)}")
+
 print("\n" + "=" * 70)
 print("✅ The new geodesic calculation provides more accurate results,")
 print("   especially at higher latitudes where the old flat-earth")
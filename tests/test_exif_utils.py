@@ -0,0 +1,71 @@
+"""Tests for the EXIF utilities of the photo projection example."""
+
+import importlib
+import pathlib
+import struct
+import sys
+import types
+
+import pytest
+
+piexif = pytest.importorskip("piexif")
+pytest.importorskip("exifread")
+
+_REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def exif_utils():
+    """Import exif_utils, which uses relative imports from the repo root."""
+    # The example imports the logger as ...src.cesiumjs_anywidget, so load it
+    # as a submodule of a package rooted at the repository
+    root = types.ModuleType("_cesiumjs_repo")
+    root.__path__ = [str(_REPO_ROOT)]
+    sys.modules["_cesiumjs_repo"] = root
+    try:
+        yield importlib.import_module("_cesiumjs_repo.examples.photo_projection.exif_utils")
+    finally:
+        for name in [n for n in sys.modules if n.startswith("_cesiumjs_repo")]:
+            del sys.modules[name]
+
+
+@pytest.fixture
+def jpeg_path(tmp_path):
+    """Write a minimal JPEG whose EXIF strings keep trailing spaces."""
+    exif = piexif.dump({
+        "0th": {
+            piexif.ImageIFD.Make: b"Canon ",
+            piexif.ImageIFD.Model: b"EOS R5 ",
+            piexif.ImageIFD.Orientation: 6,
+        },
+        "Exif": {
+            piexif.ExifIFD.DateTimeOriginal: b"2024:01:15 14:30:00",
+            piexif.ExifIFD.FocalLength: (50, 1),
+        },
+        "GPS": {
+            piexif.GPSIFD.GPSLatitudeRef: b"N",
+            piexif.GPSIFD.GPSLatitude: ((48, 1), (51, 1), (2376, 100)),
+            piexif.GPSIFD.GPSLongitudeRef: b"E",
+            piexif.GPSIFD.GPSLongitude: ((2, 1), (21, 1), (768, 100)),
+        },
+    })
+    # SOI, APP1 (EXIF), an empty SOS segment and EOI
+    data = (
+        b"\xff\xd8\xff\xe1" + struct.pack(">H", len(exif) + 2) + exif
+        + b"\xff\xda\x00\x02\xff\xd9"
+    )
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_piexif_matches_exifread(exif_utils, jpeg_path, monkeypatch):
+    """Test that the piexif fast path returns the same metadata as exifread."""
+    with_piexif = exif_utils.extract_all_metadata(jpeg_path)
+
+    monkeypatch.setattr(exif_utils, "piexif", None)
+    with_exifread = exif_utils.extract_all_metadata(jpeg_path)
+
+    assert with_piexif == with_exifread
+    assert with_piexif["make"] == "Canon "
+    assert with_piexif["model"] == "EOS R5 "
@@ -1,14 +1,44 @@
 """Tests for geoid conversion functions."""
 
+import hashlib
+import zipfile
+
+import numpy as np
 import pytest
 from cesiumjs_anywidget.geoid import (
     get_geoid_undulation,
+    get_geoid_undulation_array,
     msl_to_wgs84,
+    msl_to_wgs84_array,
     wgs84_to_msl,
+    wgs84_to_msl_array,
     clear_geoid_cache,
 )
+from cesiumjs_anywidget import geoid
+from cesiumjs_anywidget.geoid import _undulation_db_path
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _isolated_undulation_db(tmp_path_factory):
+    """Keep the persistent undulation cache out of the user's ~/.cache."""
+    db_dir = tmp_path_factory.mktemp("undulation")
+    geoid._close_undulation_db()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(geoid, "_undulation_db_path", lambda: db_dir / _undulation_db_path().name)
+        geoid._undulation_at_grid_node.cache_clear()
+        yield
+        geoid._close_undulation_db()
+    geoid._undulation_at_grid_node.cache_clear()
+
 
+@pytest.fixture(scope="module")
+def warm_geoid():
+    """Load the geoid model once per module (and per xdist worker)."""
+    get_geoid_undulation(46.0, 4.0)
+    get_geoid_undulation(46.371203, 4.635514)
 
+
+@pytest.mark.usefixtures("warm_geoid")
 class TestGetGeoidUndulation:
     """Tests for get_geoid_undulation function."""
     
@@ -34,65 +64,207 @@ class TestGetGeoidUndulation:
         
         assert result1 == result2
 
+    def test_nearby_points_share_cache_entry(self):
+        """Test that points closer than the cache resolution share one lookup."""
+        from cesiumjs_anywidget.geoid import _undulation_at_grid_node
+
+        result1 = get_geoid_undulation(46.37120, 4.63551)
+        misses = _undulation_at_grid_node.cache_info().misses
+        result2 = get_geoid_undulation(46.371203, 4.635514)
 
+        assert result1 == result2
+        assert _undulation_at_grid_node.cache_info().misses == misses
+
+
+@pytest.mark.usefixtures("warm_geoid")
 class TestMslToWgs84:
     """Tests for MSL to WGS84 conversion."""
     
-    def test_sea_level_conversion(self):
-        """Test converting sea level (0m MSL) to WGS84."""
+    @pytest.mark.parametrize("msl,lat,lon,low,high", [
         # At France location, sea level should be above WGS84 ellipsoid
-        wgs84_height = msl_to_wgs84(0, 46.371203, 4.635514)
-        
-        # With approximation, just check reasonable range
-        assert -10 < wgs84_height < 60
-    
-    def test_mountain_conversion(self):
-        """Test converting mountain altitude from MSL to WGS84."""
-        # 1000m mountain in France
-        wgs84_height = msl_to_wgs84(1000, 46.371203, 4.635514)
-        
-        # Should be roughly 1000 + undulation
-        assert 990 < wgs84_height < 1060
-    
-    def test_positive_altitude(self):
-        """Test with positive MSL altitude."""
-        wgs84 = msl_to_wgs84(500, 46.0, 4.0)
-        # Just check it's reasonable
-        assert 450 < wgs84 < 580
+        (0, 46.371203, 4.635514, -10, 60),
+        # 1000m mountain in France: roughly 1000 + undulation
+        (1000, 46.371203, 4.635514, 990, 1060),
+        (500, 46.0, 4.0, 450, 580),
+    ], ids=["sea_level", "mountain", "positive_altitude"])
+    def test_conversion_range(self, msl, lat, lon, low, high):
+        """Test that converted heights fall in a reasonable range."""
+        assert low < msl_to_wgs84(msl, lat, lon) < high
 
 
+@pytest.mark.usefixtures("warm_geoid")
 class TestWgs84ToMsl:
     """Tests for WGS84 to MSL conversion."""
     
-    def test_reverse_conversion(self):
+    @pytest.mark.parametrize("msl_original,lat,lon", [
+        (187.9, 46.371203, 4.635514),
+        (500.0, 46.0, 4.0),
+    ])
+    def test_reverse_conversion(self, msl_original, lat, lon):
         """Test that WGS84 to MSL is inverse of MSL to WGS84."""
-        lat, lon = 46.371203, 4.635514
-        msl_original = 187.9
-        
-        # Convert to WGS84 and back
         wgs84 = msl_to_wgs84(msl_original, lat, lon)
         msl_converted = wgs84_to_msl(wgs84, lat, lon)
         
         # Should get back original value (within floating point precision)
         assert abs(msl_converted - msl_original) < 0.001
+    
+    def test_roundtrip_batch(self):
+        """Test the round trip for a whole coordinate matrix in one call."""
+        lats = np.array([46.371203, 46.0, 46.0, 40.7128])
+        lons = np.array([4.635514, 4.0, 4.0, -74.0060])
+        msls = np.array([187.9, 500.0, 10000.0, 0.0])
+        
+        wgs84 = msl_to_wgs84_array(msls, lats, lons)
+        
+        np.testing.assert_allclose(wgs84_to_msl_array(wgs84, lats, lons), msls, atol=1e-3)
+        np.testing.assert_allclose(
+            wgs84, [msl_to_wgs84(m, la, lo) for m, la, lo in zip(msls, lats, lons)], atol=1e-6
+        )
+
+
+def test_invalid_latitude():
+    """Test that out-of-range latitudes are rejected without loading the model."""
+    with pytest.raises(ValueError, match="Latitudes"):
+        get_geoid_undulation_array([91.0], [0.0])
+
+
+@pytest.mark.usefixtures("warm_geoid")
+class TestArrayConversions:
+    """Tests for the vectorized geoid functions."""
+    
+    def test_matches_scalar_function(self):
+        """Test that array results agree with get_geoid_undulation."""
+        lats = [46.0, 50.0, -33.9, 0.0]
+        lons = [4.0, 10.0, 151.2, -120.0]
+        
+        undulations = get_geoid_undulation_array(lats, lons)
+        
+        assert undulations.shape == (4,)
+        for undulation, lat, lon in zip(undulations, lats, lons):
+            assert undulation == pytest.approx(get_geoid_undulation(lat, lon), abs=1e-6)
+    
+    def test_broadcasting(self):
+        """Test that scalar and array inputs broadcast together."""
+        undulations = get_geoid_undulation_array(46.0, np.array([4.0, 4.0]))
+        assert undulations.shape == (2,)
+        assert undulations[0] == undulations[1]
+    
+    def test_round_trip(self):
+        """Test that wgs84_to_msl_array inverts msl_to_wgs84_array."""
+        lats = np.array([46.371203, 40.7128])
+        lons = np.array([4.635514, -74.0060])
+        msl = np.array([187.9, 10.0])
+        
+        wgs84 = msl_to_wgs84_array(msl, lats, lons)
+        
+        assert wgs84_to_msl_array(wgs84, lats, lons) == pytest.approx(msl)
+
+
+@pytest.fixture
+def geoid_module(tmp_path, monkeypatch):
+    """Point the persistent undulation cache at a temporary directory."""
+    geoid._close_undulation_db()
+    monkeypatch.setattr(geoid, "_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(geoid, "_undulation_db_path", _undulation_db_path)
+    geoid._undulation_at_grid_node.cache_clear()
+    yield geoid
+    geoid._close_undulation_db()
+    geoid._undulation_at_grid_node.cache_clear()
+
+
+class FakeModel:
+    """Stand-in geoid model that counts height evaluations."""
+
+    calls = 0
+
+    def height(self, lat, lon):
+        FakeModel.calls += 1
+        return lat + lon
 
 
 class TestClearGeoidCache:
     """Tests for clear_geoid_cache function."""
     
-    def test_cache_clearing(self):
-        """Test that cache can be cleared without errors."""
-        # Populate cache
-        get_geoid_undulation(46.0, 4.0)
+    def test_cache_clearing(self, geoid_module, monkeypatch):
+        """Test that cleared values are computed again."""
+        monkeypatch.setattr(geoid_module, "_get_geoid_model", FakeModel)
+        monkeypatch.setattr(FakeModel, "calls", 0)
+        first = get_geoid_undulation(46.0, 4.0)
+        geoid_module._close_undulation_db()
+        
+        clear_geoid_cache()
         
-        # Clear cache
+        assert get_geoid_undulation(46.0, 4.0) == first
+        assert FakeModel.calls == 2
+    
+    def test_does_not_create_cache_file(self, geoid_module, tmp_path):
+        """Test that clearing an unused cache leaves the disk untouched."""
         clear_geoid_cache()
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestPersistentCache:
+    """Tests for the on-disk undulation cache."""
+
+    def test_values_reused_across_sessions(self, geoid_module, monkeypatch):
+        """Test that a persisted value is served without loading the model."""
+        monkeypatch.setattr(geoid_module, "_get_geoid_model", FakeModel)
+        first = get_geoid_undulation(46.0, -4.0)
+
+        # Simulate a new session: flush to disk and drop the in-memory cache
+        geoid_module._close_undulation_db()
+        geoid_module._undulation_at_grid_node.cache_clear()
+
+        def fail():
+            raise AssertionError("geoid model should not be loaded")
+
+        monkeypatch.setattr(geoid_module, "_get_geoid_model", fail)
+        assert get_geoid_undulation(46.0, -4.0) == first
+        assert get_geoid_undulation(46.0, 356.0) == first
+
+    def test_cache_file_depends_on_grid_step(self, geoid_module, monkeypatch):
+        """Test that values cached at another grid step are not reused."""
+        path = geoid_module._undulation_db_path()
+        monkeypatch.setattr(geoid_module, "_UNDULATION_GRID_STEPS_PER_DEGREE", 100)
+        assert geoid_module._undulation_db_path() != path
+
+
+class TestDownload:
+    """Tests for the EGM96 archive download (offline, via file:// URLs)."""
+    
+    @pytest.fixture
+    def archive_url(self, tmp_path):
+        """Create a ZIP archive containing a grid file and return its URL and digest."""
+        archive = tmp_path / "egm96.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("ww15mgh.grd", "-90 90 0 360 0.25 0.25\n")
+        return archive.as_uri(), hashlib.sha256(archive.read_bytes()).hexdigest()
+    
+    def test_download_and_extract(self, tmp_path, archive_url):
+        """Test that a verified archive is downloaded and extracted."""
+        from cesiumjs_anywidget.geoid import _download_egm96_grid
+        
+        url, digest = archive_url
+        cache_dir = tmp_path / "cache"
+        grd_file = _download_egm96_grid(url, cache_dir, sha256=digest)
+        
+        assert grd_file == cache_dir / "WW15MGH.GRD"
+        assert grd_file.read_text().startswith("-90 90")
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["WW15MGH.GRD"]
+    
+    def test_checksum_mismatch(self, tmp_path, archive_url):
+        """Test that a download with the wrong digest is discarded."""
+        from cesiumjs_anywidget.geoid import _download_egm96_grid
+        
+        url, _ = archive_url
+        cache_dir = tmp_path / "cache"
+        with pytest.raises(ValueError, match="SHA-256 mismatch"):
+            _download_egm96_grid(url, cache_dir, sha256="0" * 64)
         
-        # Should still work after clearing
-        result = get_geoid_undulation(46.0, 4.0)
-        assert isinstance(result, float)
+        assert list(cache_dir.iterdir()) == []
 
 
+@pytest.mark.usefixtures("warm_geoid")
 class TestEdgeCases:
     """Tests for edge cases and boundary conditions."""
     
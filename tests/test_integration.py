@@ -1,27 +1,34 @@
 """Integration tests for the CesiumWidget package."""
 
-import pytest
+import functools
 import pathlib
+import re
+
+import pytest
+
+# Matches both `export default ...` and the minified `export{x as default}`
+_ESM_EXPORT_RE = re.compile(r"\bexport\s*(?:default\b|\{)")
+
+
+@functools.cache
+def _read_index_js():
+    """Read the bundled index.js once per test session."""
+    js_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "index.js"
+    return js_path.read_text(encoding="utf-8")
 
 
 class TestPackageStructure:
     """Test package structure and imports."""
     
-    def test_package_imports(self):
-        """Test that package can be imported."""
+    @pytest.mark.parametrize("attr,check", [
+        ("__version__", lambda v: isinstance(v, str) and v),
+        ("__all__", lambda a: "CesiumWidget" in a),
+        ("CesiumWidget", lambda c: c is not None),
+    ], ids=["version", "all", "widget"])
+    def test_package_attr(self, attr, check):
+        """Test that the package exposes its public attributes."""
         import cesiumjs_anywidget
-        assert cesiumjs_anywidget is not None
-    
-    def test_widget_import(self):
-        """Test that CesiumWidget can be imported."""
-        from cesiumjs_anywidget import CesiumWidget
-        assert CesiumWidget is not None
-    
-    def test_package_all(self):
-        """Test that __all__ is defined."""
-        import cesiumjs_anywidget
-        assert hasattr(cesiumjs_anywidget, '__all__')
-        assert 'CesiumWidget' in cesiumjs_anywidget.__all__
+        assert check(getattr(cesiumjs_anywidget, attr))
 
 
 class TestWidgetInheritance:
@@ -32,50 +39,46 @@ class TestWidgetInheritance:
         import anywidget
         assert issubclass(widget_class, anywidget.AnyWidget)
     
-    def test_widget_has_esm(self, widget_instance):
+    def test_widget_has_esm(self, readonly_widget):
         """Test that widget has _esm attribute."""
-        assert hasattr(widget_instance, '_esm')
-        assert widget_instance._esm is not None
+        assert hasattr(readonly_widget, '_esm')
+        assert readonly_widget._esm is not None
     
-    def test_widget_has_css(self, widget_instance):
+    def test_widget_has_css(self, readonly_widget):
         """Test that widget has _css attribute."""
-        assert hasattr(widget_instance, '_css')
-        assert widget_instance._css is not None
+        assert hasattr(readonly_widget, '_css')
+        assert readonly_widget._css is not None
 
 
 class TestFileIntegrity:
     """Test integrity of widget files."""
     
-    def test_javascript_syntax(self, widget_instance):
+    def test_javascript_syntax(self, readonly_widget):
         """Test that JavaScript file has valid basic syntax."""
-        js_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "index.js"
-        js_content = js_path.read_text(encoding="utf-8")
+        js_content = _read_index_js()
         
         # Check for basic JavaScript syntax elements.
         # Minification renames the render function, but it is still exported
         # as the 'render' key: `var x={render:...};export{x as default}`
         assert "render" in js_content
-        # Minified bundle uses `export{...}` (no space) or `export default`
-        assert "export" in js_content
+        assert _ESM_EXPORT_RE.search(js_content)
         assert "{" in js_content and "}" in js_content
     
     def test_javascript_imports_cesium(self):
         """Test that JavaScript loads Cesium."""
-        js_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "index.js"
-        js_content = js_path.read_text(encoding="utf-8")
+        js_content = _read_index_js()
         # Check that Cesium is bundled (imported via npm, not loaded dynamically)
         assert 'Cesium' in js_content
     
-    def test_javascript_has_error_handling(self, widget_instance):
+    def test_javascript_has_error_handling(self, readonly_widget):
         """Test JavaScript has error handling."""
-        js_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "index.js"
-        js_content = js_path.read_text(encoding="utf-8")
+        js_content = _read_index_js()
         
         assert 'try' in js_content or 'catch' in js_content or 'error' in js_content.lower()
     
-    def test_css_file_valid(self, widget_instance):
+    def test_css_file_valid(self, readonly_widget):
         """Test that CSS file has valid content."""
-        css_content = widget_instance._css
+        css_content = readonly_widget._css
         # Should have some basic CSS
         assert "{" in css_content and "}" in css_content
         # Should not be empty
@@ -108,37 +111,25 @@ class TestMultipleInstances:
         assert widget2.height == "800px"
     
     def test_ten_instances(self, widget_class):
-        """Test creating many instances."""
+        """Test that ten live instances keep independent state."""
         widgets = [widget_class(latitude=float(i)) for i in range(10)]
-        
-        assert len(widgets) == 10
-        for i, widget in enumerate(widgets):
-            assert widget.latitude == float(i)
+        assert [w.latitude for w in widgets] == [float(i) for i in range(10)]
 
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
     
-    def test_extreme_altitude_low(self, widget_instance):
-        """Test very low altitude."""
-        widget_instance.altitude = 0.0
-        assert widget_instance.altitude == 0.0
+    @pytest.mark.parametrize("alt", [0.0, 1000000000.0], ids=["low", "high"])
+    def test_extreme_altitude(self, widget_instance, alt):
+        """Test very low and very high altitudes."""
+        widget_instance.altitude = alt
+        assert widget_instance.altitude == alt
     
-    def test_extreme_altitude_high(self, widget_instance):
-        """Test very high altitude."""
-        widget_instance.altitude = 1000000000.0
-        assert widget_instance.altitude == 1000000000.0
-    
-    def test_height_various_units(self, widget_instance):
+    @pytest.mark.parametrize("h", ["500px", "50%", "50vh"])
+    def test_height_various_units(self, widget_instance, h):
         """Test height with various CSS units."""
-        widget_instance.height = "500px"
-        assert widget_instance.height == "500px"
-        
-        widget_instance.height = "50%"
-        assert widget_instance.height == "50%"
-        
-        widget_instance.height = "50vh"
-        assert widget_instance.height == "50vh"
+        widget_instance.height = h
+        assert widget_instance.height == h
     
     def test_empty_geojson(self, widget_instance):
         """Test loading empty GeoJSON."""
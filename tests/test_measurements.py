@@ -4,54 +4,60 @@ import pytest
 from cesiumjs_anywidget import CesiumWidget
 
 
+@pytest.fixture(scope="module")
+def widget():
+    """Create one CesiumWidget shared by the tests in this module."""
+    return CesiumWidget()
+
+
+@pytest.fixture(autouse=True)
+def _reset_measurements(widget):
+    """Reset the traits mutated by measurement tests after each test."""
+    yield
+    widget.measurement_mode = ""
+    widget.measurement_results = []
+
+
 class TestMeasurementTools:
     """Test measurement tools functionality."""
     
-    def test_measurement_mode_default(self):
+    def test_measurement_mode_default(self, widget_instance):
         """Test that measurement_mode is empty by default."""
-        widget = CesiumWidget()
-        assert widget.measurement_mode == ""
+        assert widget_instance.measurement_mode == ""
     
-    def test_measurement_results_default(self):
+    def test_measurement_results_default(self, widget_instance):
         """Test that measurement_results is empty by default."""
-        widget = CesiumWidget()
-        assert widget.measurement_results == []
+        assert widget_instance.measurement_results == []
     
-    def test_enable_distance_measurement(self):
+    def test_enable_distance_measurement(self, widget):
         """Test enabling distance measurement mode."""
-        widget = CesiumWidget()
         widget.enable_measurement(mode="distance")
         assert widget.measurement_mode == "distance"
     
-    def test_enable_multi_distance_measurement(self):
+    def test_enable_multi_distance_measurement(self, widget):
         """Test enabling multi-distance measurement mode."""
-        widget = CesiumWidget()
         widget.enable_measurement(mode="multi-distance")
         assert widget.measurement_mode == "multi-distance"
     
-    def test_enable_height_measurement(self):
+    def test_enable_height_measurement(self, widget):
         """Test enabling height measurement mode."""
-        widget = CesiumWidget()
         widget.enable_measurement(mode="height")
         assert widget.measurement_mode == "height"
     
-    def test_enable_measurement_invalid_mode(self):
+    def test_enable_measurement_invalid_mode(self, widget):
         """Test that invalid mode raises ValueError."""
-        widget = CesiumWidget()
         with pytest.raises(ValueError, match="Invalid mode"):
             widget.enable_measurement(mode="invalid")
     
-    def test_disable_measurement(self):
+    def test_disable_measurement(self, widget):
         """Test disabling measurement mode."""
-        widget = CesiumWidget()
         widget.enable_measurement(mode="distance")
         widget.disable_measurement()
         assert widget.measurement_mode == ""
         assert widget.measurement_results == []
     
-    def test_clear_measurements(self):
+    def test_clear_measurements(self, widget):
         """Test clearing measurements."""
-        widget = CesiumWidget()
         # Simulate some measurements
         widget.measurement_results = [
             {"type": "distance", "value": 100.0, "points": []},
@@ -60,15 +66,20 @@ class TestMeasurementTools:
         widget.clear_measurements()
         assert widget.measurement_results == []
     
-    def test_get_measurements_empty(self):
+    def test_get_measurements_empty(self, widget):
         """Test getting measurements when none exist."""
-        widget = CesiumWidget()
         measurements = widget.get_measurements()
         assert measurements == []
     
-    def test_get_measurements_with_data(self):
+    def test_get_measurements_returns_copy(self, widget):
+        """Test that mutating the returned list does not change the widget."""
+        widget.measurement_results = [{"type": "distance", "value": 100.0, "points": []}]
+        measurements = widget.get_measurements()
+        measurements.clear()
+        assert len(widget.measurement_results) == 1
+
+    def test_get_measurements_with_data(self, widget):
         """Test getting measurements with data."""
-        widget = CesiumWidget()
         test_measurements = [
             {
                 "type": "distance",
@@ -92,20 +103,112 @@ class TestMeasurementTools:
         assert measurements[1]["type"] == "height"
         assert measurements[1]["value"] == 45.2
 
+    def test_add_measurements_sends_single_update(self, widget_instance):
+        """Test that batches of measurements are sent in one trigger update."""
+        updates = []
+        widget_instance.observe(updates.append, names="load_measurements_trigger")
+        distance = {"type": "distance", "points": [[2.35, 48.85, 100], [2.36, 48.86, 105]]}
+        height = {"type": "height", "points": [[2.35, 48.85, 0], [2.35, 48.85, 50]]}
+
+        widget_instance.add_measurements([[distance], [height, distance]])
+
+        assert len(updates) == 1
+        assert widget_instance.load_measurements_trigger["measurements"] == [distance, height, distance]
+
+    def test_repeated_focus_triggers_change(self, widget_instance):
+        """Test that focusing the same measurement twice notifies both times."""
+        updates = []
+        widget_instance.observe(updates.append, names="focus_measurement_trigger")
+
+        widget_instance.focus_on_measurement(0)
+        widget_instance.focus_on_measurement(0)
+
+        assert len(updates) == 2
+
+
+class TestMeasurementDeltas:
+    """Test syncing measurement results through deltas."""
+
+    def test_viewer_deltas_update_results(self, widget_instance):
+        """Test that append, update and clear deltas from the viewer are applied."""
+        first = {"type": "distance", "value": 100.0, "points": []}
+        second = {"type": "height", "value": 50.0, "points": []}
+
+        widget_instance._measurement_delta = {"op": "append", "item": first, "seq": 1}
+        widget_instance._measurement_delta = {"op": "append", "item": second, "seq": 2}
+        assert widget_instance.measurement_results == [first, second]
+
+        renamed = {**first, "name": "Renamed"}
+        widget_instance._measurement_delta = {"op": "update", "index": 0, "item": renamed, "seq": 3}
+        assert widget_instance.measurement_results == [renamed, second]
+
+        widget_instance._measurement_delta = {"op": "clear", "seq": 4}
+        assert widget_instance.measurement_results == []
+
+    def test_viewer_deltas_are_not_echoed(self, widget_instance):
+        """Test that applying a viewer delta does not send the whole list back."""
+        delta = {"op": "append", "item": {"type": "distance", "value": 1.0}, "seq": 1}
+        widget_instance._measurement_delta = delta
+        assert widget_instance._measurement_delta == delta
+
+    def test_python_assignment_sends_reset(self, widget_instance):
+        """Test that replacing the list in Python sends it to the viewer."""
+        results = [{"type": "distance", "value": 100.0, "points": []}]
+        widget_instance.measurement_results = results
+        assert widget_instance._measurement_delta["op"] == "reset"
+        assert widget_instance._measurement_delta["items"] == results
+
+    def test_concurrent_updates_resync_views(self, widget_instance):
+        """Test that an update based on a stale revision triggers a reset."""
+        item = {"type": "distance", "value": 100.0, "points": [], "rev": "a:1"}
+        widget_instance._measurement_delta = {"op": "append", "item": item, "view": "a", "seq": 1}
+
+        # Both views edit the same item, starting from revision a:1
+        from_a = {**item, "value": 110.0, "rev": "a:2"}
+        from_b = {**item, "value": 120.0, "rev": "b:1"}
+        widget_instance._measurement_delta = {
+            "op": "update", "index": 0, "base": "a:1", "item": from_a, "view": "a", "seq": 2,
+        }
+        widget_instance._measurement_delta = {
+            "op": "update", "index": 0, "base": "a:1", "item": from_b, "view": "b", "seq": 1,
+        }
+
+        assert widget_instance.measurement_results == [from_a]
+        assert widget_instance._measurement_delta["op"] == "reset"
+        assert widget_instance._measurement_delta["items"] == [from_a]
+
+    def test_out_of_range_update_sends_reset(self, widget_instance):
+        """Test that an update to a missing element resyncs the views."""
+        item = {"type": "height", "value": 5.0, "points": []}
+        widget_instance._measurement_delta = {"op": "update", "index": 0, "item": item, "seq": 1}
+
+        assert widget_instance.measurement_results == []
+        assert widget_instance._measurement_delta["op"] == "reset"
+
+    def test_sync_request_sends_reset(self, widget_instance):
+        """Test that a new view asking for the list receives a reset with it."""
+        first = {"type": "distance", "value": 100.0, "points": []}
+        widget_instance._measurement_delta = {"op": "append", "item": first, "view": "a", "seq": 1}
+
+        widget_instance._handle_custom_msg(
+            widget_instance, {"type": "measurement_sync_request"}, []
+        )
+
+        assert widget_instance._measurement_delta["op"] == "reset"
+        assert widget_instance._measurement_delta["items"] == [first]
+
 
 class TestMeasurementTraitlets:
     """Test measurement traitlets."""
     
-    def test_measurement_mode_is_unicode(self):
+    def test_measurement_mode_is_unicode(self, widget):
         """Test that measurement_mode is a Unicode traitlet."""
-        widget = CesiumWidget()
         assert hasattr(widget, 'measurement_mode')
         widget.measurement_mode = "distance"
         assert widget.measurement_mode == "distance"
     
-    def test_measurement_results_is_list(self):
+    def test_measurement_results_is_list(self, widget):
         """Test that measurement_results is a List traitlet."""
-        widget = CesiumWidget()
         assert hasattr(widget, 'measurement_results')
         assert isinstance(widget.measurement_results, list)
         
@@ -114,9 +217,8 @@ class TestMeasurementTraitlets:
         widget.measurement_results = test_data
         assert widget.measurement_results == test_data
     
-    def test_measurement_results_accepts_dicts(self):
+    def test_measurement_results_accepts_dicts(self, widget):
         """Test that measurement_results accepts list of dicts."""
-        widget = CesiumWidget()
         measurements = [
             {"type": "distance", "value": 123.45},
             {"type": "height", "value": 67.89},
@@ -129,10 +231,8 @@ class TestMeasurementTraitlets:
 class TestMeasurementIntegration:
     """Test measurement integration scenarios."""
     
-    def test_measurement_workflow_distance(self):
+    def test_measurement_workflow_distance(self, widget):
         """Test complete distance measurement workflow."""
-        widget = CesiumWidget()
-        
         # Enable distance mode
         widget.enable_measurement(mode="distance")
         assert widget.measurement_mode == "distance"
@@ -160,10 +260,8 @@ class TestMeasurementIntegration:
         assert widget.measurement_mode == ""
         assert widget.measurement_results == []
     
-    def test_measurement_workflow_height(self):
+    def test_measurement_workflow_height(self, widget):
         """Test complete height measurement workflow."""
-        widget = CesiumWidget()
-        
         # Enable height mode
         widget.enable_measurement(mode="height")
         assert widget.measurement_mode == "height"
@@ -183,10 +281,8 @@ class TestMeasurementIntegration:
         assert measurements[0]["type"] == "height"
         assert abs(measurements[0]["value"] - 85.3) < 0.01
     
-    def test_multiple_measurements(self):
+    def test_multiple_measurements(self, widget):
         """Test multiple measurements accumulation."""
-        widget = CesiumWidget()
-        
         # Add multiple measurements
         widget.measurement_results = [
             {"type": "distance", "value": 100.0, "points": []},
@@ -201,10 +297,8 @@ class TestMeasurementIntegration:
         widget.clear_measurements()
         assert len(widget.get_measurements()) == 0
     
-    def test_measurement_mode_switching(self):
+    def test_measurement_mode_switching(self, widget):
         """Test switching between measurement modes."""
-        widget = CesiumWidget()
-        
         # Switch between modes
         widget.enable_measurement(mode="distance")
         assert widget.measurement_mode == "distance"
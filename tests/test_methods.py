@@ -7,100 +7,50 @@ import json
 class TestFlyToMethod:
     """Test the fly_to method."""
     
-    def test_fly_to_basic(self, widget_instance):
-        """Test basic fly_to functionality."""
-        widget_instance.fly_to(40.7128, -74.0060, 50000)
-        assert widget_instance.latitude == 40.7128
-        assert widget_instance.longitude == -74.0060
-        assert widget_instance.altitude == 50000
-    
-    def test_fly_to_default_altitude(self, widget_instance):
-        """Test fly_to with default altitude."""
-        widget_instance.fly_to(latitude=51.5074, longitude=-0.1278)
-        
-        assert widget_instance.latitude == 51.5074
-        assert widget_instance.longitude == -0.1278
-        assert widget_instance.altitude == 400  # default
-    
-    def test_fly_to_negative_coordinates(self, widget_instance):
-        """Test fly_to with negative coordinates."""
-        widget_instance.fly_to(-33.8688, 151.2093, 25000)
-        assert widget_instance.latitude == -33.8688
-        assert widget_instance.longitude == 151.2093
-        assert widget_instance.altitude == 25000
-    
-    def test_fly_to_zero_coordinates(self, widget_instance):
-        """Test fly_to with zero coordinates."""
-        widget_instance.fly_to(0.0, 0.0, 100000)
-        assert widget_instance.latitude == 0.0
-        assert widget_instance.longitude == 0.0
-        assert widget_instance.altitude == 100000
-    
-    def test_fly_to_extreme_latitude(self, widget_instance):
-        """Test fly_to with extreme latitude values."""
-        widget_instance.fly_to(89.9, 0.0, 50000)
-        assert widget_instance.latitude == 89.9
-        
-        widget_instance.fly_to(-89.9, 0.0, 50000)
-        assert widget_instance.latitude == -89.9
-    
-    def test_fly_to_extreme_longitude(self, widget_instance):
-        """Test fly_to with extreme longitude values."""
-        widget_instance.fly_to(0.0, 179.9, 50000)
-        assert widget_instance.longitude == 179.9
-        
-        widget_instance.fly_to(0.0, -179.9, 50000)
-        assert widget_instance.longitude == -179.9
+    @pytest.mark.parametrize("lat,lon,alt,expected_alt", [
+        (40.7128, -74.0060, 50000, 50000),
+        (51.5074, -0.1278, None, 400),  # default altitude
+        (-33.8688, 151.2093, 25000, 25000),
+        (0.0, 0.0, 100000, 100000),
+        (89.9, 0.0, 50000, 50000),
+        (-89.9, 0.0, 50000, 50000),
+        (0.0, 179.9, 50000, 50000),
+        (0.0, -179.9, 50000, 50000),
+    ], ids=["basic", "default_altitude", "negative", "zero",
+            "north_pole", "south_pole", "east_antimeridian", "west_antimeridian"])
+    def test_fly_to(self, widget_instance, lat, lon, alt, expected_alt):
+        """Test that fly_to updates the camera position traits."""
+        if alt is None:
+            widget_instance.fly_to(lat, lon)
+        else:
+            widget_instance.fly_to(lat, lon, alt)
+        assert widget_instance.latitude == lat
+        assert widget_instance.longitude == lon
+        assert widget_instance.altitude == expected_alt
 
 
 class TestSetViewMethod:
     """Test the set_view method."""
     
-    def test_set_view_basic(self, widget_instance):
-        """Test set_view with basic parameters."""
-        widget_instance.set_view(latitude=51.5074, longitude=-0.1278)
-        
-        assert widget_instance.latitude == 51.5074
-        assert widget_instance.longitude == -0.1278
-        assert widget_instance.altitude == 400  # default
-        assert widget_instance.heading == 0.0  # default
-        assert widget_instance.pitch == -15.0  # default
-        assert widget_instance.roll == 0.0  # default
-    
-    def test_set_view_with_altitude(self, widget_instance):
-        """Test set_view with custom altitude."""
-        widget_instance.set_view(48.8566, 2.3522, altitude=25000)
-        assert widget_instance.latitude == 48.8566
-        assert widget_instance.longitude == 2.3522
-        assert widget_instance.altitude == 25000
-    
-    def test_set_view_with_orientation(self, widget_instance):
-        """Test set_view with custom orientation."""
-        widget_instance.set_view(
-            40.7128, -74.0060,
-            altitude=5000,
-            heading=45.0,
-            pitch=-45.0,
-            roll=10.0
-        )
-        assert widget_instance.latitude == 40.7128
-        assert widget_instance.longitude == -74.0060
-        assert widget_instance.altitude == 5000
-        assert widget_instance.heading == 45.0
-        assert widget_instance.pitch == -45.0
-        assert widget_instance.roll == 10.0
-    
-    def test_set_view_full_rotation(self, widget_instance):
-        """Test set_view with full rotation values."""
-        widget_instance.set_view(
-            0.0, 0.0,
-            heading=360.0,
-            pitch=-90.0,
-            roll=0.0
-        )
-        assert widget_instance.heading == 360.0
-        assert widget_instance.pitch == -90.0
-        assert widget_instance.roll == 0.0
+    @pytest.mark.parametrize("args,kwargs,expected", [
+        ((51.5074, -0.1278), {},
+         # altitude and orientation defaults
+         {"latitude": 51.5074, "longitude": -0.1278, "altitude": 400,
+          "heading": 0.0, "pitch": -15.0, "roll": 0.0}),
+        ((48.8566, 2.3522), {"altitude": 25000},
+         {"latitude": 48.8566, "longitude": 2.3522, "altitude": 25000}),
+        ((40.7128, -74.0060),
+         {"altitude": 5000, "heading": 45.0, "pitch": -45.0, "roll": 10.0},
+         {"latitude": 40.7128, "longitude": -74.0060, "altitude": 5000,
+          "heading": 45.0, "pitch": -45.0, "roll": 10.0}),
+        ((0.0, 0.0), {"heading": 360.0, "pitch": -90.0, "roll": 0.0},
+         {"heading": 360.0, "pitch": -90.0, "roll": 0.0}),
+    ], ids=["basic", "altitude", "orientation", "full_rotation"])
+    def test_set_view(self, widget_instance, args, kwargs, expected):
+        """Test that set_view updates the camera traits."""
+        widget_instance.set_view(*args, **kwargs)
+        for name, value in expected.items():
+            assert getattr(widget_instance, name) == value
     
     def test_set_view_overwrites_previous(self, widget_instance):
         """Test that set_view overwrites previous values."""
@@ -121,69 +71,31 @@ class TestLoadGeoJSONMethod:
         assert widget_instance.geojson_data is not None
         assert widget_instance.geojson_data == [sample_geojson]
     
-    def test_load_geojson_string(self, widget_instance, sample_geojson):
+    def test_load_geojson_string(self, widget_instance, sample_geojson, sample_geojson_str):
         """Test loading GeoJSON from JSON string."""
-        geojson_string = json.dumps(sample_geojson)
-        widget_instance.load_geojson(geojson_string)
+        widget_instance.load_geojson(sample_geojson_str)
         assert widget_instance.geojson_data is not None
         assert widget_instance.geojson_data == [sample_geojson]
     
-    def test_load_geojson_point(self, widget_instance):
+    def test_load_geojson_point(self, widget_instance, geojson_point):
         """Test loading single point GeoJSON."""
-        geojson = {
-            "type": "Feature",
-            "geometry": {
-                "type": "Point",
-                "coordinates": [-74.0060, 40.7128]
-            },
-            "properties": {"name": "Test"}
-        }
-        widget_instance.load_geojson(geojson)
-        assert widget_instance.geojson_data == [geojson]
+        widget_instance.load_geojson(geojson_point)
+        assert widget_instance.geojson_data == [geojson_point]
     
-    def test_load_geojson_polygon(self, widget_instance):
+    def test_load_geojson_polygon(self, widget_instance, geojson_polygon):
         """Test loading polygon GeoJSON."""
-        geojson = {
-            "type": "Feature",
-            "geometry": {
-                "type": "Polygon",
-                "coordinates": [[
-                    [0, 0], [1, 0], [1, 1], [0, 1], [0, 0]
-                ]]
-            }
-        }
-        widget_instance.load_geojson(geojson)
-        assert widget_instance.geojson_data == [geojson]
+        widget_instance.load_geojson(geojson_polygon)
+        assert widget_instance.geojson_data == [geojson_polygon]
     
-    def test_load_geojson_linestring(self, widget_instance):
+    def test_load_geojson_linestring(self, widget_instance, geojson_linestring):
         """Test loading LineString GeoJSON."""
-        geojson = {
-            "type": "Feature",
-            "geometry": {
-                "type": "LineString",
-                "coordinates": [[0, 0], [1, 1], [2, 2]]
-            }
-        }
-        widget_instance.load_geojson(geojson)
-        assert widget_instance.geojson_data == [geojson]
+        widget_instance.load_geojson(geojson_linestring)
+        assert widget_instance.geojson_data == [geojson_linestring]
     
-    def test_load_geojson_feature_collection(self, widget_instance):
+    def test_load_geojson_feature_collection(self, widget_instance, geojson_feature_collection):
         """Test loading FeatureCollection GeoJSON."""
-        geojson = {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": {"type": "Point", "coordinates": [0, 0]}
-                },
-                {
-                    "type": "Feature",
-                    "geometry": {"type": "Point", "coordinates": [1, 1]}
-                }
-            ]
-        }
-        widget_instance.load_geojson(geojson)
-        assert widget_instance.geojson_data == [geojson]
+        widget_instance.load_geojson(geojson_feature_collection)
+        assert widget_instance.geojson_data == [geojson_feature_collection]
         assert len(widget_instance.geojson_data[0]["features"]) == 2
     
     def test_load_geojson_overwrites(self, widget_instance, sample_geojson):
@@ -199,6 +111,45 @@ class TestLoadGeoJSONMethod:
         assert widget_instance.geojson_data == [new_geojson]
         assert widget_instance.geojson_data != sample_geojson
 
+    def test_stream_geojson_sends_ndjson_chunks(self, widget_instance, monkeypatch):
+        """Test that streamed features arrive as ordered NDJSON chunks."""
+        sent = []
+        monkeypatch.setattr(
+            widget_instance, "_send", lambda msg, buffers=None: sent.append((msg["content"], buffers))
+        )
+        features = [
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [i, 0]}, "properties": {}}
+            for i in range(50)
+        ]
+
+        widget_instance.stream_geojson({"type": "FeatureCollection", "features": features}, chunk_size=500)
+
+        assert len(sent) > 1
+        assert [content["seq"] for content, _ in sent] == list(range(len(sent)))
+        assert [content["final"] for content, _ in sent] == [False] * (len(sent) - 1) + [True]
+        lines = b"".join(buffers[0] for _, buffers in sent).splitlines()
+        assert [json.loads(line) for line in lines] == features
+        assert widget_instance.geojson_data == []
+
+
+class TestLoadCZMLMethod:
+    """Test the load_czml method."""
+
+    def test_load_czml_string(self, widget_instance):
+        """Test loading CZML from a JSON string."""
+        czml = [
+            {"id": "document", "version": "1.0"},
+            {"id": "point", "position": {"cartographicDegrees": [-74, 40, 0]}},
+        ]
+        widget_instance.load_czml(json.dumps(czml))
+        assert widget_instance.czml_data == [czml]
+
+    def test_load_czml_rejects_non_dict_packets(self, widget_instance):
+        """Test that packets which are not dictionaries are rejected."""
+        with pytest.raises(ValueError, match="dictionaries"):
+            widget_instance.load_czml([{"id": "document", "version": "1.0"}, "point"])
+        assert widget_instance.czml_data == []
+
 
 class TestWidgetState:
     """Test widget state management."""
@@ -241,48 +192,26 @@ class TestDebugMethod:
     
     def test_debug_info_runs(self, widget_instance, capsys):
         """Test that debug_info method runs without errors."""
-        # Temporarily redirect to avoid file path issues
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        try:
-            widget_instance.debug_info()
-            output = sys.stdout.getvalue()
-            assert "CesiumWidget Debug Info" in output
-        finally:
-            sys.stdout = old_stdout
+        widget_instance.debug_info()
+        output = capsys.readouterr().out
+        assert "CesiumWidget Debug Info" in output
     
-    def test_debug_info_shows_paths(self, widget_instance):
+    def test_debug_info_shows_paths(self, widget_instance, capsys):
         """Test that debug_info shows file paths."""
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        try:
-            widget_instance.debug_info()
-            output = sys.stdout.getvalue()
-            assert "JavaScript file:" in output
-            assert "CSS file:" in output
-            assert "Path:" in output
-            assert "Exists:" in output
-        finally:
-            sys.stdout = old_stdout
+        widget_instance.debug_info()
+        output = capsys.readouterr().out
+        assert "JavaScript file:" in output
+        assert "CSS file:" in output
+        assert "Path:" in output
+        assert "Exists:" in output
     
     def test_debug_info_shows_state(self, widget_instance, capsys):
         """Test that debug_info shows widget state."""
-        import io
-        import sys
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
-        try:
-            widget_instance.debug_info()
-            output = sys.stdout.getvalue()
-            assert "Current state:" in output
-            assert "Position:" in output
-            assert "Altitude:" in output
-        finally:
-            sys.stdout = old_stdout
+        widget_instance.debug_info()
+        output = capsys.readouterr().out
+        assert "Current state:" in output
+        assert "Position:" in output
+        assert "Altitude:" in output
     
     def test_debug_info_shows_tips(self, widget_instance, capsys):
         """Test that debug_info shows debugging tips."""
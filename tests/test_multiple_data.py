@@ -1,16 +1,11 @@
-#!/usr/bin/env python
-"""Test script to verify multiple GeoJSON/CZML loading and clearing"""
+"""Tests for loading and clearing multiple GeoJSON/CZML datasets."""
 
-from cesiumjs_anywidget import CesiumWidget
+import pytest
 
-# Create widget
-w = CesiumWidget()
+from cesiumjs_anywidget import CesiumWidget
 
-print("Testing multiple GeoJSON and CZML loading:")
-print("=" * 60)
 
-# Test GeoJSON
-geojson1 = {
+GEOJSON_1 = {
     "type": "FeatureCollection",
     "features": [{
         "type": "Feature",
@@ -19,7 +14,7 @@ geojson1 = {
     }]
 }
 
-geojson2 = {
+GEOJSON_2 = {
     "type": "FeatureCollection",
     "features": [{
         "type": "Feature",
@@ -28,71 +23,86 @@ geojson2 = {
     }]
 }
 
-print("\n1. Loading first GeoJSON...")
-w.load_geojson(geojson1)
-print(f"   GeoJSON data count: {len(w.geojson_data)}")
-assert len(w.geojson_data) == 1, "Should have 1 GeoJSON dataset"
-
-print("\n2. Loading second GeoJSON (appending)...")
-w.load_geojson(geojson2, append=True)
-print(f"   GeoJSON data count: {len(w.geojson_data)}")
-assert len(w.geojson_data) == 2, "Should have 2 GeoJSON datasets"
-
-print("\n3. Clearing GeoJSON...")
-w.clear_geojson()
-print(f"   GeoJSON data count: {len(w.geojson_data)}")
-assert len(w.geojson_data) == 0, "Should have 0 GeoJSON datasets"
-
-print("\n4. Loading GeoJSON with replace (default)...")
-w.load_geojson(geojson1, append=True)
-w.load_geojson(geojson2, append=True)
-print(f"   Before: {len(w.geojson_data)} datasets")
-w.load_geojson(geojson1)  # Replace by default
-print(f"   After replace: {len(w.geojson_data)} datasets")
-assert len(w.geojson_data) == 1, "Should have 1 GeoJSON dataset"
-
-# Test CZML
-czml1 = [
+CZML_1 = [
     {"id": "document", "version": "1.0"},
     {"id": "point1", "position": {"cartographicDegrees": [-74, 40, 0]}}
 ]
 
-czml2 = [
+CZML_2 = [
     {"id": "document", "version": "1.0"},
     {"id": "point2", "position": {"cartographicDegrees": [2, 48, 0]}}
 ]
 
-print("\n5. Loading first CZML...")
-w.clear_czml()
-w.load_czml(czml1)
-print(f"   CZML data count: {len(w.czml_data)}")
-assert len(w.czml_data) == 1, "Should have 1 CZML document"
-
-print("\n6. Loading second CZML (appending)...")
-w.load_czml(czml2, append=True)
-print(f"   CZML data count: {len(w.czml_data)}")
-assert len(w.czml_data) == 2, "Should have 2 CZML documents"
-
-print("\n7. Clearing CZML...")
-w.clear_czml()
-print(f"   CZML data count: {len(w.czml_data)}")
-assert len(w.czml_data) == 0, "Should have 0 CZML documents"
-
-print("\n8. Loading CZML with replace (default)...")
-w.load_czml(czml1, append=True)
-w.load_czml(czml2, append=True)
-print(f"   Before: {len(w.czml_data)} documents")
-w.load_czml(czml1)  # Replace by default
-print(f"   After replace: {len(w.czml_data)} documents")
-assert len(w.czml_data) == 1, "Should have 1 CZML document"
-
-print("\n" + "=" * 60)
-print("✅ All tests passed!")
-print("=" * 60)
-print("\nNew capabilities:")
-print("  • load_geojson() - Load GeoJSON data (replaces by default)")
-print("  • load_geojson(data, append=True) - Append GeoJSON data")
-print("  • clear_geojson() - Clear all GeoJSON data")
-print("  • load_czml() - Load CZML documents (replaces by default)")
-print("  • load_czml(data, append=True) - Append CZML data")
-print("  • clear_czml() - Clear all CZML data")
+
+@pytest.fixture(scope="module")
+def w():
+    """Create one CesiumWidget shared by the tests in this module."""
+    return CesiumWidget()
+
+
+@pytest.fixture(autouse=True)
+def _clear_data(w):
+    """Start and finish every test with no GeoJSON or CZML loaded."""
+    w.clear_geojson()
+    w.clear_czml()
+    yield
+    w.clear_geojson()
+    w.clear_czml()
+
+
+def test_load_first_geojson(w):
+    """Test loading a single GeoJSON dataset."""
+    w.load_geojson(GEOJSON_1)
+    assert len(w.geojson_data) == 1
+
+
+def test_append_second_geojson(w):
+    """Test appending a second GeoJSON dataset."""
+    w.load_geojson(GEOJSON_1)
+    w.load_geojson(GEOJSON_2, append=True)
+    assert w.geojson_data == [GEOJSON_1, GEOJSON_2]
+
+
+def test_clear_geojson(w):
+    """Test clearing all GeoJSON datasets."""
+    w.load_geojson(GEOJSON_1)
+    w.load_geojson(GEOJSON_2, append=True)
+    w.clear_geojson()
+    assert w.geojson_data == []
+
+
+def test_load_geojson_replaces_existing(w):
+    """Test that load_geojson replaces existing datasets by default."""
+    w.load_geojson(GEOJSON_1, append=True)
+    w.load_geojson(GEOJSON_2, append=True)
+    w.load_geojson(GEOJSON_1)
+    assert w.geojson_data == [GEOJSON_1]
+
+
+def test_load_first_czml(w):
+    """Test loading a single CZML document."""
+    w.load_czml(CZML_1)
+    assert len(w.czml_data) == 1
+
+
+def test_append_second_czml(w):
+    """Test appending a second CZML document."""
+    w.load_czml(CZML_1)
+    w.load_czml(CZML_2, append=True)
+    assert len(w.czml_data) == 2
+
+
+def test_clear_czml(w):
+    """Test clearing all CZML documents."""
+    w.load_czml(CZML_1)
+    w.load_czml(CZML_2, append=True)
+    w.clear_czml()
+    assert w.czml_data == []
+
+
+def test_load_czml_replaces_existing(w):
+    """Test that load_czml replaces existing documents by default."""
+    w.load_czml(CZML_1, append=True)
+    w.load_czml(CZML_2, append=True)
+    w.load_czml(CZML_1)
+    assert len(w.czml_data) == 1
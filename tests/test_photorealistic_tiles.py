@@ -1,18 +1,32 @@
 """Tests for Google Photorealistic 3D Tiles functionality."""
 
+import pytest
+
 from cesiumjs_anywidget import CesiumWidget
 
 
-def test_photorealistic_tiles_default_disabled():
+# Traits shared by every widget built through make_widget
+_WIDGET_DEFAULTS = {"height": "600px"}
+
+
+@pytest.fixture
+def make_widget():
+    """Return a factory building a CesiumWidget from the shared defaults."""
+    def _make(**kwargs):
+        return CesiumWidget(**{**_WIDGET_DEFAULTS, **kwargs})
+    return _make
+
+
+def test_photorealistic_tiles_default_disabled(make_widget):
     """Test that photorealistic tiles are disabled by default."""
-    widget = CesiumWidget()
+    widget = make_widget()
     assert widget.enable_photorealistic_tiles is False
     assert widget.show_globe is True
 
 
-def test_photorealistic_tiles_enable_on_creation():
+def test_photorealistic_tiles_enable_on_creation(make_widget):
     """Test enabling photorealistic tiles during widget creation."""
-    widget = CesiumWidget(
+    widget = make_widget(
         enable_photorealistic_tiles=True,
         show_globe=False,
         enable_terrain=False
@@ -22,9 +36,9 @@ def test_photorealistic_tiles_enable_on_creation():
     assert widget.enable_terrain is False
 
 
-def test_photorealistic_tiles_enable_after_creation():
+def test_photorealistic_tiles_enable_after_creation(make_widget):
     """Test enabling photorealistic tiles after widget creation."""
-    widget = CesiumWidget()
+    widget = make_widget()
     
     # Initially disabled
     assert widget.enable_photorealistic_tiles is False
@@ -38,9 +52,9 @@ def test_photorealistic_tiles_enable_after_creation():
     assert widget.enable_photorealistic_tiles is False
 
 
-def test_enable_photorealistic_3d_tiles_method():
+def test_enable_photorealistic_3d_tiles_method(make_widget):
     """Test the convenience method for enabling photorealistic tiles."""
-    widget = CesiumWidget()
+    widget = make_widget()
     
     # Initially disabled
     assert widget.enable_photorealistic_tiles is False
@@ -58,9 +72,9 @@ def test_enable_photorealistic_3d_tiles_method():
     assert widget.show_globe is True
 
 
-def test_enable_photorealistic_3d_tiles_default_parameter():
+def test_enable_photorealistic_3d_tiles_default_parameter(make_widget):
     """Test that the convenience method defaults to True."""
-    widget = CesiumWidget()
+    widget = make_widget()
     
     # Call without parameter (should default to True)
     widget.enable_photorealistic_3d_tiles()
@@ -68,9 +82,9 @@ def test_enable_photorealistic_3d_tiles_default_parameter():
     assert widget.show_globe is False
 
 
-def test_show_globe_independent_control():
+def test_show_globe_independent_control(make_widget):
     """Test that show_globe can be controlled independently."""
-    widget = CesiumWidget(enable_photorealistic_tiles=True)
+    widget = make_widget(enable_photorealistic_tiles=True)
     
     # Initially should be whatever default is
     # Enable photorealistic tiles, disable globe
@@ -83,9 +97,9 @@ def test_show_globe_independent_control():
     assert widget.enable_photorealistic_tiles is True
 
 
-def test_photorealistic_tiles_with_other_settings():
+def test_photorealistic_tiles_with_other_settings(make_widget):
     """Test photorealistic tiles work with other widget settings."""
-    widget = CesiumWidget(
+    widget = make_widget(
         enable_photorealistic_tiles=True,
         show_globe=False,
         enable_terrain=False,
@@ -106,22 +120,25 @@ def test_photorealistic_tiles_with_other_settings():
     assert widget.altitude == 2000
 
 
-def test_photorealistic_tiles_state_changes():
+@pytest.fixture(scope="module")
+def toggled_widget():
+    """Create one CesiumWidget whose tiles setting is toggled across cases."""
+    return CesiumWidget()
+
+
+@pytest.mark.parametrize(
+    "value", [True, False] * 3,
+    ids=[f"{state}-{n}" for n in range(1, 4) for state in ("on", "off")],
+)
+def test_photorealistic_tiles_state_changes(toggled_widget, value):
     """Test multiple state changes of photorealistic tiles."""
-    widget = CesiumWidget()
-    
-    # Toggle multiple times
-    for i in range(3):
-        widget.enable_photorealistic_tiles = True
-        assert widget.enable_photorealistic_tiles is True
-        
-        widget.enable_photorealistic_tiles = False
-        assert widget.enable_photorealistic_tiles is False
+    toggled_widget.enable_photorealistic_tiles = value
+    assert toggled_widget.enable_photorealistic_tiles is value
 
 
-def test_photorealistic_tiles_with_camera_methods():
+def test_photorealistic_tiles_with_camera_methods(make_widget):
     """Test that photorealistic tiles work with camera control methods."""
-    widget = CesiumWidget(enable_photorealistic_tiles=True, show_globe=False)
+    widget = make_widget(enable_photorealistic_tiles=True, show_globe=False)
     
     # Test fly_to
     widget.fly_to(latitude=40.7128, longitude=-74.0060, altitude=2000)
@@ -132,13 +149,11 @@ def test_photorealistic_tiles_with_camera_methods():
     assert widget.enable_photorealistic_tiles is True
 
 
-def test_photorealistic_tiles_traitlet_sync():
+def test_photorealistic_tiles_traitlet_sync(make_widget):
     """Test that photorealistic tiles settings are properly tagged for sync."""
-    widget = CesiumWidget()
-    
-    # Check that the trait has sync tag
-    trait = widget.traits()['enable_photorealistic_tiles']
-    assert trait.metadata.get('sync', False) is True
+    widget = make_widget()
     
-    trait = widget.traits()['show_globe']
-    assert trait.metadata.get('sync', False) is True
+    # Check that the traits have the sync tag
+    traits = widget.traits()
+    assert traits['enable_photorealistic_tiles'].metadata.get('sync', False) is True
+    assert traits['show_globe'].metadata.get('sync', False) is True
@@ -1,109 +1,67 @@
-#!/usr/bin/env python3
-"""Test script for sky atmosphere configuration functionality."""
+"""Tests for sky atmosphere configuration functionality."""
 
-import sys
-sys.path.insert(0, 'src')
+import pytest
 
-from cesiumjs_anywidget import CesiumWidget
+# Earth-like Rayleigh and Mie scattering coefficients, in 1/m
+EARTH_RAYLEIGH = (5.5e-6, 13.0e-6, 22.4e-6)
+EARTH_MIE = (21e-6, 21e-6, 21e-6)
 
-def test_sky_atmosphere_settings():
-    """Test that sky atmosphere settings can be configured."""
-    print("Testing sky atmosphere configuration...")
-    
-    # Create widget
-    widget = CesiumWidget()
-    print("✓ Widget created")
-    
-    # Test show/hide
-    widget.set_sky_atmosphere(show=False)
-    assert not widget.sky_atmosphere_settings['show']
-    print("✓ Show/hide works")
-    
-    widget.set_sky_atmosphere(show=True)
-    assert widget.sky_atmosphere_settings['show']
-    print("✓ Show enabled")
-    
-    # Test brightness shift
-    widget.set_sky_atmosphere(brightness_shift=-0.3)
-    assert widget.sky_atmosphere_settings['brightnessShift'] == -0.3
-    print("✓ Brightness shift works")
-    
-    # Test hue and saturation
-    widget.set_sky_atmosphere(hue_shift=0.5, saturation_shift=-0.2)
-    assert widget.sky_atmosphere_settings['hueShift'] == 0.5
-    assert widget.sky_atmosphere_settings['saturationShift'] == -0.2
-    print("✓ Hue and saturation shifts work")
-    
-    # Test light intensity
-    widget.set_sky_atmosphere(light_intensity=12.0)
-    assert widget.sky_atmosphere_settings['atmosphereLightIntensity'] == 12.0
-    print("✓ Light intensity works")
-    
-    # Test Rayleigh coefficient (tuple of 3 floats)
-    widget.set_sky_atmosphere(rayleigh_coefficient=(5.5e-6, 13.0e-6, 22.4e-6))
-    assert len(widget.sky_atmosphere_settings['atmosphereRayleighCoefficient']) == 3
-    print("✓ Rayleigh coefficient works")
-    
-    # Test Mie coefficient
-    widget.set_sky_atmosphere(mie_coefficient=(21e-6, 21e-6, 21e-6))
-    assert len(widget.sky_atmosphere_settings['atmosphereMieCoefficient']) == 3
-    print("✓ Mie coefficient works")
-    
-    # Test scale heights
-    widget.set_sky_atmosphere(rayleigh_scale_height=8000.0, mie_scale_height=1200.0)
-    assert widget.sky_atmosphere_settings['atmosphereRayleighScaleHeight'] == 8000.0
-    assert widget.sky_atmosphere_settings['atmosphereMieScaleHeight'] == 1200.0
-    print("✓ Scale heights work")
-    
-    # Test mie anisotropy
-    widget.set_sky_atmosphere(mie_anisotropy=0.9)
-    assert widget.sky_atmosphere_settings['atmosphereMieAnisotropy'] == 0.9
-    print("✓ Mie anisotropy works")
-    
-    # Test per-fragment atmosphere
-    widget.set_sky_atmosphere(per_fragment_atmosphere=True)
-    assert widget.sky_atmosphere_settings['perFragmentAtmosphere']
-    print("✓ Per-fragment atmosphere works")
-    
-    # Test combined settings
-    widget.set_sky_atmosphere(
+
+@pytest.mark.parametrize("kwargs,expected", [
+    ({"show": False}, {"show": False}),
+    ({"show": True}, {"show": True}),
+    ({"brightness_shift": -0.3}, {"brightnessShift": -0.3}),
+    ({"hue_shift": 0.5, "saturation_shift": -0.2},
+     {"hueShift": 0.5, "saturationShift": -0.2}),
+    ({"light_intensity": 12.0}, {"atmosphereLightIntensity": 12.0}),
+    ({"rayleigh_coefficient": EARTH_RAYLEIGH},
+     {"atmosphereRayleighCoefficient": list(EARTH_RAYLEIGH)}),
+    ({"mie_coefficient": EARTH_MIE},
+     {"atmosphereMieCoefficient": list(EARTH_MIE)}),
+    ({"rayleigh_scale_height": 8000.0, "mie_scale_height": 1200.0},
+     {"atmosphereRayleighScaleHeight": 8000.0, "atmosphereMieScaleHeight": 1200.0}),
+    ({"mie_anisotropy": 0.9}, {"atmosphereMieAnisotropy": 0.9}),
+    ({"per_fragment_atmosphere": True}, {"perFragmentAtmosphere": True}),
+    ({"show": True, "brightness_shift": -0.2, "hue_shift": 0.1,
+      "saturation_shift": 0.3, "per_fragment_atmosphere": True},
+     {"show": True, "brightnessShift": -0.2, "hueShift": 0.1,
+      "saturationShift": 0.3, "perFragmentAtmosphere": True}),
+])
+def test_set_sky_atmosphere(widget_instance, kwargs, expected):
+    """Test that set_sky_atmosphere maps keyword arguments to settings keys."""
+    widget_instance.set_sky_atmosphere(**kwargs)
+    settings = widget_instance.sky_atmosphere_settings
+    assert settings.keys() == expected.keys()
+    for key, value in expected.items():
+        assert settings[key] == pytest.approx(value, rel=1e-9)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"rayleigh_coefficient": (1.0, 2.0)},
+    {"mie_coefficient": (1.0, 2.0, 3.0, 4.0)},
+])
+def test_sky_atmosphere_validation(widget_instance, kwargs):
+    """Test that coefficient tuples must have three components."""
+    with pytest.raises(ValueError, match="must be a tuple of 3 floats"):
+        widget_instance.set_sky_atmosphere(**kwargs)
+
+
+def test_combined_settings_notify_once(widget_instance):
+    """Test that several settings are sent in a single trait update."""
+    changes = []
+    widget_instance.observe(changes.append, names="sky_atmosphere_settings")
+    widget_instance.set_sky_atmosphere(
         show=True,
         brightness_shift=-0.2,
         hue_shift=0.1,
         saturation_shift=0.3,
         per_fragment_atmosphere=True
     )
-    assert widget.sky_atmosphere_settings['show']
-    assert widget.sky_atmosphere_settings['brightnessShift'] == -0.2
-    assert widget.sky_atmosphere_settings['hueShift'] == 0.1
-    assert widget.sky_atmosphere_settings['saturationShift'] == 0.3
-    assert widget.sky_atmosphere_settings['perFragmentAtmosphere']
-    print("✓ Combined settings work")
-    
-    # Test reset (empty dict)
-    widget.sky_atmosphere_settings = {}
-    assert len(widget.sky_atmosphere_settings) == 0
-    print("✓ Reset works")
-    
-    # Test validation
-    try:
-        widget.set_sky_atmosphere(rayleigh_coefficient=(1.0, 2.0))  # Wrong length
-        assert False, "Should have raised ValueError"
-    except ValueError as e:
-        assert "must be a tuple of 3 floats" in str(e)
-        print("✓ Input validation works")
-    
-    print("\n✅ All sky atmosphere configuration tests passed!")
-    return True
+    assert len(changes) == 1
+
 
-if __name__ == '__main__':
-    try:
-        test_sky_atmosphere_settings()
-    except AssertionError as e:
-        print(f"\n❌ Test failed: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+def test_sky_atmosphere_reset(widget_instance):
+    """Test that assigning an empty dict resets the settings."""
+    widget_instance.set_sky_atmosphere(show=False)
+    widget_instance.sky_atmosphere_settings = {}
+    assert widget_instance.sky_atmosphere_settings == {}
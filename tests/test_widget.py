@@ -1,8 +1,61 @@
 """Unit tests for CesiumWidget class initialization and configuration."""
 
-import pytest
 import pathlib
 
+import pytest
+
+from cesiumjs_anywidget import CesiumWidget
+
+_SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src" / "cesiumjs_anywidget"
+_ESM_PATH = _SRC_DIR / "index.js"
+_CSS_PATH = _SRC_DIR / "styles.css"
+
+
+@pytest.fixture(scope="module")
+def _shared_widget():
+    """Create one widget and snapshot its synced trait values."""
+    widget = CesiumWidget()
+    # Traits are replaced, not mutated in place, so references are enough
+    defaults = {name: getattr(widget, name) for name in widget.trait_names(sync=True)}
+    return widget, defaults
+
+
+@pytest.fixture
+def mutable_widget(_shared_widget):
+    """Yield the shared widget and restore any synced trait a test changed."""
+    widget, defaults = _shared_widget
+    yield widget
+    for name, value in defaults.items():
+        if getattr(widget, name) != value:
+            setattr(widget, name, value)
+
+
+# Expected trait values of a widget built without arguments
+_DEFAULTS = {
+    "latitude": -122.4175,
+    "longitude": 37.655,
+    "altitude": 400.0,
+    "heading": 0.0,
+    "pitch": -15.0,
+    "roll": 0.0,
+    "height": "600px",
+    "enable_terrain": True,
+    "enable_lighting": False,
+    "show_timeline": True,
+    "show_animation": True,
+    "request_render_mode": True,
+    "maximum_render_time_change": None,
+    "ion_access_token": "",
+    "geojson_data": [],
+    "request_render_trigger": {},
+}
+
+
+@pytest.fixture(scope="module", params=[{}, _DEFAULTS], ids=["implicit", "explicit"])
+def widget_and_expected(request):
+    """Build one widget per parameter set, paired with the expected defaults."""
+    return CesiumWidget(**request.param), _DEFAULTS
+
 
 class TestWidgetInitialization:
     """Test widget initialization and default values."""
@@ -12,101 +65,37 @@ class TestWidgetInitialization:
         widget = widget_class()
         assert widget is not None
     
-    def test_default_camera_position(self, widget_instance):
-        """Test default camera position."""
-        assert widget_instance.latitude == -122.4175
-        assert widget_instance.longitude == 37.655
-        assert widget_instance.altitude == 400.0
-    
-    def test_default_camera_orientation(self, widget_instance):
-        """Test default camera orientation."""
-        assert widget_instance.heading == 0.0
-        assert widget_instance.pitch == -15.0
-        assert widget_instance.roll == 0.0
-    
-    def test_default_viewer_config(self, widget_instance):
-        """Test default viewer configuration."""
-        assert widget_instance.height == "600px"
-        assert widget_instance.enable_terrain is True
-        assert widget_instance.enable_lighting is False
-        assert widget_instance.show_timeline is True
-        assert widget_instance.show_animation is True
-        assert widget_instance.request_render_mode is True
-        assert widget_instance.maximum_render_time_change is None
-    
-    def test_default_ion_token(self, widget_instance):
-        """Test default Cesium Ion token."""
-        assert widget_instance.ion_access_token == ""
-    
-    def test_default_geojson_data(self, widget_instance):
-        """Test default GeoJSON data."""
-        assert widget_instance.geojson_data == []
-
-    def test_default_request_render_trigger(self, widget_instance):
-        """Test default explicit render trigger state."""
-        assert widget_instance.request_render_trigger == {}
+    @pytest.mark.parametrize("attr", list(_DEFAULTS))
+    def test_default_value(self, widget_and_expected, attr):
+        """Test each default trait value, both implicit and passed explicitly."""
+        widget, expected = widget_and_expected
+        value = getattr(widget, attr)
+        assert value == expected[attr]
+        assert type(value) is type(expected[attr])
 
 
 class TestWidgetConfiguration:
     """Test widget configuration with custom values."""
     
-    def test_custom_camera_position(self, widget_class):
-        """Test widget with custom camera position."""
-        widget = widget_class(
-            latitude=40.7128,
-            longitude=-74.0060,
-            altitude=50000
-        )
-        assert widget.latitude == 40.7128
-        assert widget.longitude == -74.0060
-        assert widget.altitude == 50000
-    
-    def test_custom_camera_orientation(self, widget_class):
-        """Test widget with custom camera orientation."""
-        widget = widget_class(
-            heading=45.0,
-            pitch=-45.0,
-            roll=10.0
-        )
-        assert widget.heading == 45.0
-        assert widget.pitch == -45.0
-        assert widget.roll == 10.0
-    
-    def test_custom_height(self, widget_class):
-        """Test widget with custom height."""
-        widget = widget_class(height="800px")
-        assert widget.height == "800px"
-    
-    def test_terrain_enabled(self, widget_class):
-        """Test widget with terrain enabled."""
-        widget = widget_class(enable_terrain=True)
-        assert widget.enable_terrain is True
-    
-    def test_terrain_disabled(self, widget_class):
-        """Test widget with terrain disabled."""
-        widget = widget_class(enable_terrain=False)
-        assert widget.enable_terrain is False
-    
-    def test_lighting_enabled(self, widget_class):
-        """Test widget with lighting enabled."""
-        widget = widget_class(enable_lighting=True)
-        assert widget.enable_lighting is True
-    
-    def test_timeline_enabled(self, widget_class):
-        """Test widget with timeline enabled."""
-        widget = widget_class(show_timeline=True)
-        assert widget.show_timeline is True
-    
-    def test_animation_enabled(self, widget_class):
-        """Test widget with animation enabled."""
-        widget = widget_class(show_animation=True)
-        assert widget.show_animation is True
-    
-    def test_ion_token_custom(self, widget_class):
-        """Test widget with custom Ion token."""
-        token = "test_token_12345"
-        widget = widget_class(ion_access_token=token)
-        assert widget.ion_access_token == token
+    @pytest.mark.parametrize("kwargs", [
+        {"latitude": 40.7128, "longitude": -74.0060, "altitude": 50000},
+        {"heading": 45.0, "pitch": -45.0, "roll": 10.0},
+        {"height": "800px"},
+        {"enable_terrain": True},
+        {"enable_terrain": False},
+        {"enable_lighting": True},
+        {"show_timeline": True},
+        {"show_animation": True},
+        {"ion_access_token": "test_token_12345"},
+        {"request_render_mode": False, "maximum_render_time_change": 0.0},
+    ], ids=["camera_position", "camera_orientation", "height", "terrain_enabled",
+            "terrain_disabled", "lighting", "timeline", "animation", "ion_token",
+            "render_performance"])
+    def test_custom_config(self, widget_class, kwargs):
+        """Test that constructor keyword arguments set the matching traits."""
+        widget = widget_class(**kwargs)
+        for name, value in kwargs.items():
+            assert getattr(widget, name) == value
     
     def test_all_custom_config(self, widget_with_config):
         """Test widget with all custom configuration."""
@@ -119,15 +108,6 @@ class TestWidgetConfiguration:
         assert widget_with_config.show_timeline is True
         assert widget_with_config.show_animation is True
 
-    def test_custom_render_performance_options(self, widget_class):
-        """Test widget with custom render performance options."""
-        widget = widget_class(
-            request_render_mode=False,
-            maximum_render_time_change=0.0,
-        )
-        assert widget.request_render_mode is False
-        assert widget.maximum_render_time_change == 0.0
-
     def test_request_render_method_updates_trigger(self, widget_instance):
         """Test request_render method updates trigger payload."""
         widget_instance.request_render()
@@ -138,112 +118,53 @@ class TestWidgetConfiguration:
 class TestWidgetFiles:
     """Test widget file loading and paths."""
     
-    def test_esm_file_path(self, widget_instance):
-        """Test that _esm points to a valid file."""
-        # After anywidget loads, _esm is a string, but we can check the class
-        esm_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "index.js"
-        assert esm_path.exists(), f"ESM file not found at {esm_path}"
-    
-    def test_esm_file_exists(self, widget_instance):
-        """Test that the ESM file exists."""
-        esm_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "index.js"
-        assert esm_path.exists(), f"ESM file not found at {esm_path}"
+    @pytest.mark.parametrize("path", [_ESM_PATH, _CSS_PATH], ids=["esm", "css"])
+    def test_asset_exists(self, path):
+        """Test that the bundled ESM and CSS files exist."""
+        assert path.is_file(), f"Asset file not found at {path}"
     
-    def test_esm_file_readable(self, widget_instance):
+    def test_esm_file_readable(self, readonly_widget):
         """Test that the ESM file can be read."""
         # Check that widget has ESM content (anywidget loads it as string)
-        assert isinstance(widget_instance._esm, str)
-        assert len(widget_instance._esm) > 0
-        assert "render" in widget_instance._esm
-    
-    def test_css_file_path(self, widget_instance):
-        """Test that _css points to a valid file."""
-        css_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "styles.css"
-        assert css_path.exists(), f"CSS file not found at {css_path}"
+        assert isinstance(readonly_widget._esm, str)
+        assert len(readonly_widget._esm) > 0
+        assert "render" in readonly_widget._esm
     
-    def test_css_file_exists(self, widget_instance):
-        """Test that the CSS file exists."""
-        css_path = pathlib.Path(__file__).parent.parent / "src" / "cesiumjs_anywidget" / "styles.css"
-        assert css_path.exists(), f"CSS file not found at {css_path}"
-    
-    def test_css_file_readable(self, widget_instance):
+    def test_css_file_readable(self, readonly_widget):
         """Test that the CSS file can be read."""
         # Check that widget has CSS content (anywidget loads it as string)
-        assert isinstance(widget_instance._css, str)
-        assert len(widget_instance._css) > 0
+        assert isinstance(readonly_widget._css, str)
+        assert len(readonly_widget._css) > 0
 
 
 class TestTraitlets:
     """Test that traitlets are properly configured."""
     
-    def test_latitude_is_float(self, widget_instance):
-        """Test that latitude trait accepts floats."""
-        widget_instance.latitude = 45.5
-        assert widget_instance.latitude == 45.5
-    
-    def test_longitude_is_float(self, widget_instance):
-        """Test that longitude trait accepts floats."""
-        widget_instance.longitude = -120.3
-        assert widget_instance.longitude == -120.3
-    
-    def test_altitude_is_float(self, widget_instance):
-        """Test that altitude trait accepts floats."""
-        widget_instance.altitude = 10000.5
-        assert widget_instance.altitude == 10000.5
-    
-    def test_heading_is_float(self, widget_instance):
-        """Test that heading trait accepts floats."""
-        widget_instance.heading = 90.0
-        assert widget_instance.heading == 90.0
-    
-    def test_pitch_is_float(self, widget_instance):
-        """Test that pitch trait accepts floats."""
-        widget_instance.pitch = -45.0
-        assert widget_instance.pitch == -45.0
-    
-    def test_roll_is_float(self, widget_instance):
-        """Test that roll trait accepts floats."""
-        widget_instance.roll = 5.0
-        assert widget_instance.roll == 5.0
-    
-    def test_height_is_string(self, widget_instance):
-        """Test that height trait accepts strings."""
-        widget_instance.height = "500px"
-        assert widget_instance.height == "500px"
-    
-    def test_enable_terrain_is_bool(self, widget_instance):
-        """Test that enable_terrain trait accepts booleans."""
-        widget_instance.enable_terrain = False
-        assert widget_instance.enable_terrain is False
-    
-    def test_enable_lighting_is_bool(self, widget_instance):
-        """Test that enable_lighting trait accepts booleans."""
-        widget_instance.enable_lighting = True
-        assert widget_instance.enable_lighting is True
-    
-    def test_show_timeline_is_bool(self, widget_instance):
-        """Test that show_timeline trait accepts booleans."""
-        widget_instance.show_timeline = True
-        assert widget_instance.show_timeline is True
-    
-    def test_show_animation_is_bool(self, widget_instance):
-        """Test that show_animation trait accepts booleans."""
-        widget_instance.show_animation = True
-        assert widget_instance.show_animation is True
-
-    def test_request_render_mode_is_bool(self, widget_instance):
-        """Test that request_render_mode trait accepts booleans."""
-        widget_instance.request_render_mode = False
-        assert widget_instance.request_render_mode is False
+    @pytest.mark.parametrize("attr,value", [
+        ("latitude", 45.5),
+        ("longitude", -120.3),
+        ("altitude", 10000.5),
+        ("heading", 90.0),
+        ("pitch", -45.0),
+        ("roll", 5.0),
+        ("height", "500px"),
+        ("enable_terrain", False),
+        ("enable_lighting", True),
+        ("show_timeline", True),
+        ("show_animation", True),
+        ("request_render_mode", False),
+        ("request_render_trigger", {"timestamp": 1.0}),
+    ])
+    def test_trait_roundtrip(self, mutable_widget, attr, value):
+        """Test that each trait accepts and returns a value of its type."""
+        setattr(mutable_widget, attr, value)
+        result = getattr(mutable_widget, attr)
+        assert result == value
+        assert type(result) is type(value)
 
-    def test_maximum_render_time_change_is_nullable_float(self, widget_instance):
+    def test_maximum_render_time_change_is_nullable_float(self, mutable_widget):
         """Test that maximum_render_time_change accepts float and None."""
-        widget_instance.maximum_render_time_change = 0.25
-        assert widget_instance.maximum_render_time_change == 0.25
-        widget_instance.maximum_render_time_change = None
-        assert widget_instance.maximum_render_time_change is None
-
-    def test_request_render_trigger_is_dict(self, widget_instance):
-        """Test that request_render_trigger trait accepts dictionaries."""
-        widget_instance.request_render_trigger = {"timestamp": 1.0}
-        assert widget_instance.request_render_trigger == {"timestamp": 1.0}
+        mutable_widget.maximum_render_time_change = 0.25
+        assert mutable_widget.maximum_render_time_change == 0.25
+        mutable_widget.maximum_render_time_change = None
+        assert mutable_widget.maximum_render_time_change is None